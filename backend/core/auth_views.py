@@ -2,18 +2,83 @@
 Authentication views for JWT token management with httpOnly cookies.
 """
 
+import hashlib
+import json
+import logging
+import time
+
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework.throttling import AnonRateThrottle
+from rest_framework_simplejwt.tokens import RefreshToken, UntypedToken
 from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
 from django.contrib.auth import authenticate
 from django.conf import settings
-from core.serializers import (
-    LoginSerializer,
-    UserSerializer,
-)
+from django.core.cache import cache
+from django.http import HttpResponse
+from core.renderers import ORJSONRenderer
+from core.serializers import LoginSerializer, get_user_payload
+from core.tasks import blacklist_refresh_token
+
+logger = logging.getLogger(__name__)
+
+REFRESH_COOKIE_NAME = "refresh_token"
+REFRESH_COOKIE_MAX_AGE = 7 * 24 * 60 * 60  # 7 days (matches token lifetime)
+REFRESH_COOKIE_PATH = "/api/v1/auth/"  # Only sent to auth endpoints
+
+# Refresh cookie attributes, resolved once at import
+_REFRESH_COOKIE_KWARGS = {
+    "httponly": True,  # Cannot be accessed by JavaScript (XSS protection)
+    "secure": not settings.DEBUG,  # HTTPS only in production
+    "samesite": "Lax",  # CSRF protection (allows top-level navigation)
+    "max_age": REFRESH_COOKIE_MAX_AGE,
+    "path": REFRESH_COOKIE_PATH,
+}
+# Expires the refresh cookie with the same attributes it was set with.
+# HttpResponse.delete_cookie() can't mark the deletion Secure, which
+# browsers may ignore for a cookie originally set as Secure.
+_CLEAR_COOKIE_KWARGS = {**_REFRESH_COOKIE_KWARGS, "max_age": 0}
+
+
+def _error_body(message: str) -> bytes:
+    return json.dumps({"error": message}, separators=(",", ":")).encode()
+
+
+# Canned error bodies, encoded once. Failed auth attempts (e.g. credential
+# stuffing against /login/) skip DRF's negotiation and render pipeline.
+_INVALID_CREDENTIALS = _error_body("Invalid credentials")
+_REFRESH_TOKEN_NOT_FOUND = _error_body("Refresh token not found")
+_INVALID_REFRESH_TOKEN = _error_body("Invalid or expired refresh token")
+_INVALID_TOKEN = _error_body("Invalid token")
+
+
+def _error_response(body: bytes, status_code: int) -> HttpResponse:
+    return HttpResponse(body, status=status_code, content_type="application/json")
+
+
+# Refresh token -> minted access token, kept in the shared cache. Bursts of
+# refreshes from the same client skip signature verification and the
+# blacklist lookup. Entries live at most 60s; invalid tokens are never
+# cached. Logout replaces the entry with REFRESH_TOKEN_REVOKED for the rest
+# of the token's lifetime, so every worker rejects it at once, even before
+# the queued blacklist task has run.
+REFRESH_CACHE_MAX_TTL = 60
+REFRESH_TOKEN_REVOKED = "revoked"
+
+
+def _refresh_cache_key(refresh_token: str) -> str:
+    digest = hashlib.blake2b(refresh_token.encode(), digest_size=16).hexdigest()
+    return f"auth:refresh:{digest}"
+
+
+class LoginRateThrottle(AnonRateThrottle):
+    """Rate limit login attempts per IP before any password hashing runs."""
+
+    scope = "login"
+    rate = "10/min"
 
 
 class LoginView(APIView):
@@ -26,9 +91,12 @@ class LoginView(APIView):
     - Access token: Returned in JSON (stored in memory by frontend)
     - Refresh token: Set as httpOnly cookie (inaccessible to JavaScript)
     - CSRF token: Auto-set by Django middleware
+    - Attempts throttled per IP (LoginRateThrottle) before authenticate()
     """
 
     permission_classes = [AllowAny]
+    renderer_classes = [ORJSONRenderer]
+    throttle_classes = [LoginRateThrottle, AnonRateThrottle]
     serializer_class = LoginSerializer
 
     def post(self, request):
@@ -41,39 +109,28 @@ class LoginView(APIView):
         # Authenticate user
         user = authenticate(request, username=email, password=password)
 
+        # EmailOrUsernameBackend (the only backend) rejects disabled accounts
+        # after one dummy hash, so they look like wrong credentials
         if user is None:
-            return Response(
-                {"error": "Invalid credentials"},
-                status=status.HTTP_401_UNAUTHORIZED,
-            )
-
-        if not user.is_active:
-            return Response(
-                {"error": "User account is disabled"},
-                status=status.HTTP_401_UNAUTHORIZED,
-            )
+            return _error_response(_INVALID_CREDENTIALS, status.HTTP_401_UNAUTHORIZED)
 
-        # Generate tokens
+        # Generate and sign each token exactly once. SimpleJWT doesn't memoize
+        # str(token), and refresh.access_token builds a new token per access.
         refresh = RefreshToken.for_user(user)
+        access_token = str(refresh.access_token)
+        refresh_token = str(refresh)
 
         # Prepare response with only access token and user data
         response_data = {
-            "access_token": str(refresh.access_token),
-            "user": UserSerializer(user).data,
+            "access_token": access_token,
+            "user": get_user_payload(user),
         }
 
         response = Response(response_data, status=status.HTTP_200_OK)
 
         # Set refresh token as httpOnly cookie (XSS protection)
-        is_production = settings.DEBUG is False
         response.set_cookie(
-            key="refresh_token",
-            value=str(refresh),
-            httponly=True,  # Cannot be accessed by JavaScript (XSS protection)
-            secure=is_production,  # HTTPS only in production
-            samesite="Lax",  # CSRF protection (allows top-level navigation)
-            max_age=7 * 24 * 60 * 60,  # 7 days (matches token lifetime)
-            path="/api/v1/auth/",  # Only sent to auth endpoints
+            REFRESH_COOKIE_NAME, refresh_token, **_REFRESH_COOKIE_KWARGS
         )
 
         return response
@@ -91,32 +148,61 @@ class RefreshTokenView(APIView):
     """
 
     permission_classes = [AllowAny]
+    renderer_classes = [ORJSONRenderer]
 
     def post(self, request):
         # Read refresh token from httpOnly cookie
-        refresh_token = request.COOKIES.get("refresh_token")
+        refresh_token = request.COOKIES.get(REFRESH_COOKIE_NAME)
 
         if not refresh_token:
-            return Response(
-                {"error": "Refresh token not found"},
-                status=status.HTTP_401_UNAUTHORIZED,
+            return _error_response(
+                _REFRESH_TOKEN_NOT_FOUND, status.HTTP_401_UNAUTHORIZED
             )
 
+        cache_key = _refresh_cache_key(refresh_token)
         try:
-            # Validate and refresh the token
-            refresh = RefreshToken(refresh_token)
-            access_token = str(refresh.access_token)
-
+            access_token = cache.get(cache_key)
+        except Exception as e:
+            # Cache unavailable - fall back to full verification
+            logger.warning(f"Failed to read refresh token cache: {e}")
+            access_token = None
+        if access_token == REFRESH_TOKEN_REVOKED:
+            return _error_response(
+                _INVALID_REFRESH_TOKEN, status.HTTP_401_UNAUTHORIZED
+            )
+        if access_token is not None:
             return Response(
                 {"access_token": access_token},
                 status=status.HTTP_200_OK,
             )
+
+        try:
+            # Validate and refresh the token
+            refresh = RefreshToken(refresh_token)
+            access = refresh.access_token
+            access_token = str(access)
         except TokenError:
-            return Response(
-                {"error": "Invalid or expired refresh token"},
-                status=status.HTTP_401_UNAUTHORIZED,
+            return _error_response(
+                _INVALID_REFRESH_TOKEN, status.HTTP_401_UNAUTHORIZED
             )
 
+        timeout = min(
+            refresh["exp"] - time.time(),
+            access["exp"] - time.time(),
+            REFRESH_CACHE_MAX_TTL,
+        )
+        if timeout > 0:
+            # add() never overwrites a revocation from a concurrent logout
+            try:
+                cache.add(cache_key, access_token, int(timeout))
+            except Exception as e:
+                logger.warning(f"Failed to cache refreshed access token: {e}")
+
+        return Response(
+            {"access_token": access_token},
+            status=status.HTTP_200_OK,
+        )
+
 
 class LogoutView(APIView):
     """
@@ -125,58 +211,79 @@ class LogoutView(APIView):
 
     Security:
     - Reads refresh_token from httpOnly cookie
-    - Blacklists the token to prevent reuse
+    - Revokes the token in the shared cache, so refresh stops accepting it
+      on every worker immediately
+    - Blacklists the token to prevent reuse (queued; inline if the broker
+      is unavailable)
     - Clears the httpOnly cookie
     - Requires authentication (valid access token)
     """
 
     permission_classes = [IsAuthenticated]
+    renderer_classes = [ORJSONRenderer]
 
     def post(self, request):
-        try:
-            # Read refresh token from httpOnly cookie
-            refresh_token = request.COOKIES.get("refresh_token")
+        # Read refresh token from httpOnly cookie
+        refresh_token = request.COOKIES.get(REFRESH_COOKIE_NAME)
 
-            if not refresh_token:
-                return Response(
-                    {"error": "Refresh token not found"},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
+        if not refresh_token:
+            return _error_response(
+                _REFRESH_TOKEN_NOT_FOUND, status.HTTP_400_BAD_REQUEST
+            )
 
-            # Blacklist the refresh token
-            token = RefreshToken(refresh_token)
-            token.blacklist()
+        # Verify signature, expiry and type only; the blacklist lookup and
+        # writes happen in the queued task
+        try:
+            token = UntypedToken(refresh_token)
+            token_type = token.get(jwt_settings.TOKEN_TYPE_CLAIM)
+        except TokenError:
+            token_type = None
+        if token_type != RefreshToken.token_type:
+            return _error_response(_INVALID_TOKEN, status.HTTP_400_BAD_REQUEST)
+
+        # Revoke in the shared cache first so no worker serves another
+        # access token for it while the blacklist task is queued
+        remaining = int(token["exp"] - time.time())
+        if remaining > 0:
+            try:
+                cache.set(
+                    _refresh_cache_key(refresh_token), REFRESH_TOKEN_REVOKED, remaining
+                )
+            except Exception as e:
+                # Cache unavailable - refresh can't read it either, so the
+                # blacklist below still stops the token
+                logger.warning(f"Failed to revoke refresh token in cache: {e}")
 
-            # Create response
-            response = Response(
-                {"message": "Successfully logged out"}, status=status.HTTP_200_OK
-            )
+        # Blacklist the refresh token
+        try:
+            blacklist_refresh_token.delay(refresh_token)
+        except Exception as e:
+            # Broker unavailable - blacklist inline rather than skip it
+            logger.warning(f"Failed to queue refresh token blacklist: {e}")
+            blacklist_refresh_token(refresh_token)
 
-            # Clear the httpOnly cookie
-            response.delete_cookie(
-                key="refresh_token",
-                path="/api/v1/auth/",
-                samesite="Lax",
-            )
+        # Create response
+        response = Response(
+            {"message": "Successfully logged out"}, status=status.HTTP_200_OK
+        )
 
-            return response
+        # Clear the httpOnly cookie
+        response.set_cookie(REFRESH_COOKIE_NAME, "", **_CLEAR_COOKIE_KWARGS)
 
-        except TokenError:
-            return Response(
-                {"error": "Invalid token"}, status=status.HTTP_400_BAD_REQUEST
-            )
-        except Exception as e:
-            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return response
 
 
 class CurrentUserView(APIView):
     """
     GET /api/v1/auth/me/
     Return current authenticated user details with role and permissions.
+
+    The payload is cached for a few minutes; core.signals invalidates it
+    when the user, their groups or their permissions change.
     """
 
     permission_classes = [IsAuthenticated]
+    renderer_classes = [ORJSONRenderer]
 
     def get(self, request):
-        serializer = UserSerializer(request.user)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(get_user_payload(request.user), status=status.HTTP_200_OK)
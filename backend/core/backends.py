@@ -1,7 +1,11 @@
 from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db.models import Q
 
 User = get_user_model()
+# Bound once so authenticate() skips the manager descriptor on each call
+_user_manager = User._default_manager
 
 
 class EmailOrUsernameBackend(ModelBackend):
@@ -13,15 +17,22 @@ class EmailOrUsernameBackend(ModelBackend):
         if username is None:
             return None
 
-        # Try to fetch user by email first
-        try:
-            user = User.objects.get(email=username)
-        except User.DoesNotExist:
-            # Fall back to username
-            try:
-                user = User.objects.get(username=username)
-            except User.DoesNotExist:
-                return None
+        # Fetch by email or username in a single query. An email match wins
+        # if the identifier happens to hit two different users.
+        candidates = list(
+            _user_manager.filter(Q(email__iexact=username) | Q(username=username))[:2]
+        )
+        user = next(
+            (c for c in candidates if c.email.lower() == username.lower()),
+            candidates[0] if candidates else None,
+        )
+
+        # Missing and disabled accounts never check the stored hash, but run
+        # the hasher once anyway so both take as long as a wrong password
+        # (mitigates user enumeration via timing).
+        if user is None or not self.user_can_authenticate(user):
+            make_password(password)
+            return None
 
         # Check password
         if user.check_password(password):
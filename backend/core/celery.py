@@ -28,4 +28,10 @@ app.conf.beat_schedule = {
         "task": "quotes.tasks.expire_old_quotes",
         "schedule": crontab(hour=0, minute=0),  # Daily at midnight
     },
+    # Queued emails are flushed as soon as they're queued; this sweep picks
+    # up deferred retries and anything queued while workers were down
+    "send-queued-mail": {
+        "task": "post_office.tasks.send_queued_mail",
+        "schedule": 60.0,
+    },
 }
@@ -4,14 +4,22 @@ class ServiceException(Exception):
     default_detail = "A service error occurred."
     default_code = "service_error"
 
+    # Instances fall back to these class-level values; __init__ only stores
+    # an override when the caller passes one.
+    detail = default_detail
+    code = default_code
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.detail = cls.default_detail
+        cls.code = cls.default_code
+
     def __init__(self, detail=None, code=None):
-        if detail is None:
-            detail = self.default_detail
-        if code is None:
-            code = self.default_code
-        self.detail = detail
-        self.code = code
-        super().__init__(detail)
+        if detail is not None:
+            self.detail = detail
+        if code is not None:
+            self.code = code
+        super().__init__(self.detail)
 
 
 class VehicleNotFoundException(ServiceException):
@@ -1,5 +1,7 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import Group
 
 User = get_user_model()
@@ -8,6 +10,7 @@ User = get_user_model()
 class Command(BaseCommand):
     help = "Creates test users for development"
 
+    @transaction.atomic
     def handle(self, *args, **options):
         users: list[dict] = [
             {
@@ -36,29 +39,45 @@ class Command(BaseCommand):
             },
         ]
 
-        for user_data in users:
-            username: str = user_data["username"]
-            if not User.objects.filter(username=username).exists():
-                user = User.objects.create_user(
-                    username=username,
-                    email=user_data["email"],
-                    password=user_data["password"],
+        existing = set(
+            User.objects.filter(
+                username__in=[u["username"] for u in users]
+            ).values_list("username", flat=True)
+        )
+        # Collect output and write it in one go at the end
+        lines = []
+        for username in sorted(existing):
+            lines.append(f"User exists: {username}")
+
+        new_users = [u for u in users if u["username"] not in existing]
+        created = User.objects.bulk_create(
+            [
+                User(
+                    username=user_data["username"],
+                    email=User.objects.normalize_email(user_data["email"]),
+                    password=make_password(user_data["password"]),
                     is_staff=user_data["is_staff"],
                     is_superuser=user_data["is_superuser"],
                 )
-                self.stdout.write(self.style.SUCCESS(f"Created user: {username}"))
+                for user_data in new_users
+            ]
+        )
 
-                # Assign groups
-                for group_name in user_data.get("groups", []):
-                    try:
-                        group = Group.objects.get(name=group_name)
-                        user.groups.add(group)
-                        self.stdout.write(f"  Added to group: {group_name}")
-                    except Group.DoesNotExist:
-                        self.stdout.write(
-                            self.style.WARNING(f"  Group not found: {group_name}")
-                        )
-            else:
-                self.stdout.write(f"User exists: {username}")
+        # Assign groups with one lookup and one M2M insert
+        group_names = {name for u in new_users for name in u.get("groups", [])}
+        groups = {g.name: g for g in Group.objects.filter(name__in=group_names)}
+        Membership = User.groups.through
+        memberships = []
+        for user, user_data in zip(created, new_users):
+            lines.append(self.style.SUCCESS(f"Created user: {user.username}"))
+            for group_name in user_data.get("groups", []):
+                group = groups.get(group_name)
+                if group is None:
+                    lines.append(self.style.WARNING(f"  Group not found: {group_name}"))
+                    continue
+                memberships.append(Membership(user_id=user.pk, group_id=group.pk))
+                lines.append(f"  Added to group: {group_name}")
+        Membership.objects.bulk_create(memberships, ignore_conflicts=True)
 
-        self.stdout.write(self.style.SUCCESS("Successfully created test users"))
+        lines.append(self.style.SUCCESS("Successfully created test users"))
+        self.stdout.write("\n".join(lines))
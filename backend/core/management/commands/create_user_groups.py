@@ -1,10 +1,12 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.contrib.auth.models import Group, Permission
 
 
 class Command(BaseCommand):
     help = "Creates default user groups and permissions"
 
+    @transaction.atomic
     def handle(self, *args, **options):
         # Define groups
         groups = {
@@ -32,17 +34,18 @@ class Command(BaseCommand):
                 self.stdout.write(f"Group exists: {group_name}")
 
             if permissions == "__all__":
-                # Admin gets all permissions
-                # In reality, superusers have all perms, but we can assign all to
-                # Admin group too
-                pass
+                # Superusers already have every permission, but mirror that on
+                # the Admin group so staff in it get the same access
+                group.permissions.set(Permission.objects.all())
+                self.stdout.write("  Assigned all permissions")
             elif permissions:
+                perms = list(Permission.objects.filter(codename__in=permissions))
+                group.permissions.add(*perms)
+                found = {perm.codename for perm in perms}
                 for codename in permissions:
-                    try:
-                        perm = Permission.objects.get(codename=codename)
-                        group.permissions.add(perm)
+                    if codename in found:
                         self.stdout.write(f"  Added permission: {codename}")
-                    except Permission.DoesNotExist:
+                    else:
                         self.stdout.write(
                             self.style.WARNING(f"  Permission not found: {codename}")
                         )
@@ -1,13 +1,55 @@
-from typing import List, Dict, Any
+import csv
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.contrib.gis.geos import Point
 from pricing.models import PricingConfig, InsuranceProvider, PricingProfile
 from shops.models import Shop, ServiceArea
 
 
+# Insurance providers as (code, other fields) pairs
+INSURANCE_PROVIDERS: Tuple[Tuple[str, Dict[str, Any]], ...] = (
+    ("statefarm", {"name": "State Farm", "uses_custom_pricing": False}),
+    (
+        "geico",
+        {"name": "Geico", "uses_custom_pricing": True, "markup_multiplier": 1.25},
+    ),
+    ("progressive", {"name": "Progressive", "uses_custom_pricing": False}),
+    ("allstate", {"name": "Allstate", "uses_custom_pricing": False}),
+    (
+        "usaa",
+        {"name": "USAA", "uses_custom_pricing": True, "markup_multiplier": 1.20},
+    ),
+    ("libertymutual", {"name": "Liberty Mutual", "uses_custom_pricing": False}),
+    ("farmers", {"name": "Farmers", "uses_custom_pricing": False}),
+    ("nationwide", {"name": "Nationwide", "uses_custom_pricing": False}),
+)
+
+
+# All Speedy Glass locations from speedy-locations.md, one row per shop.
+# Coordinates are pre-geocoded (lon, lat) for the PostGIS Point.
+SHOPS_CSV = Path(__file__).with_name("_shops.csv")
+
+# Rows per bulk INSERT
+BATCH_SIZE = 500
+
+
+def load_shops() -> List[Dict[str, str]]:
+    """Read the shop seed rows from SHOPS_CSV."""
+    with SHOPS_CSV.open(newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def _mkpt(lon: float, lat: float) -> Point:
+    """Build a WGS84 point for a shop location."""
+    return Point(lon, lat, srid=4326)
+
+
 class Command(BaseCommand):
     help = "Seeds initial data for shops, pricing, and service areas"
 
+    @transaction.atomic
     def handle(self, *args, **options):
         self.seed_pricing_config()
         self.seed_insurance_providers()
@@ -16,378 +58,138 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS("Successfully seeded core data"))
 
     def seed_pricing_config(self):
-        config, created = PricingConfig.objects.get_or_create(
+        # Cheap existence check first; only build the row on the insert path
+        if PricingConfig.objects.filter(pk=1).exists():
+            self.stdout.write("PricingConfig already exists")
+            return
+
+        PricingConfig.objects.create(
             pk=1,
-            defaults={
-                "standard_labor_rate": 150.00,
-                "complex_labor_rate": 200.00,
-                "environmental_fee": 5.00,
-                "disposal_fee": 10.00,
-                "markup_multiplier": 1.30,
-                "mobile_fee_tier_1_amount": 25.00,
-                "mobile_fee_tier_2_amount": 50.00,
-                "mobile_fee_tier_3_amount": 75.00,
-                "max_mobile_service_distance": 50,
-                "quote_expiration_days": 7,
-            },
+            standard_labor_rate=150.00,
+            complex_labor_rate=200.00,
+            environmental_fee=5.00,
+            disposal_fee=10.00,
+            markup_multiplier=1.30,
+            mobile_fee_tier_1_amount=25.00,
+            mobile_fee_tier_2_amount=50.00,
+            mobile_fee_tier_3_amount=75.00,
+            max_mobile_service_distance=50,
+            quote_expiration_days=7,
         )
-        if created:
-            self.stdout.write("Created PricingConfig")
-        else:
-            self.stdout.write("PricingConfig already exists")
+        self.stdout.write("Created PricingConfig")
 
     def seed_insurance_providers(self):
-        providers = [
-            {"name": "State Farm", "code": "statefarm", "uses_custom_pricing": False},
-            {
-                "name": "Geico",
-                "code": "geico",
-                "uses_custom_pricing": True,
-                "markup_multiplier": 1.25,
-            },
-            {
-                "name": "Progressive",
-                "code": "progressive",
-                "uses_custom_pricing": False,
-            },
-            {"name": "Allstate", "code": "allstate", "uses_custom_pricing": False},
-            {
-                "name": "USAA",
-                "code": "usaa",
-                "uses_custom_pricing": True,
-                "markup_multiplier": 1.20,
-            },
-            {
-                "name": "Liberty Mutual",
-                "code": "libertymutual",
-                "uses_custom_pricing": False,
-            },
-            {"name": "Farmers", "code": "farmers", "uses_custom_pricing": False},
-            {"name": "Nationwide", "code": "nationwide", "uses_custom_pricing": False},
+        # The unique code column makes the insert idempotent; the lookup only
+        # decides which providers to report as created.
+        existing = set(
+            InsuranceProvider.objects.filter(
+                code__in=[code for code, _ in INSURANCE_PROVIDERS]
+            ).values_list("code", flat=True)
+        )
+        new_providers = [
+            (code, fields)
+            for code, fields in INSURANCE_PROVIDERS
+            if code not in existing
         ]
-        for p in providers:
-            obj, created = InsuranceProvider.objects.get_or_create(
-                code=p["code"], defaults=p
+        InsuranceProvider.objects.bulk_create(
+            [InsuranceProvider(code=code, **fields) for code, fields in new_providers],
+            ignore_conflicts=True,
+        )
+        if new_providers:
+            self.stdout.write(
+                "\n".join(
+                    f"Created InsuranceProvider: {fields['name']}"
+                    for _, fields in new_providers
+                )
             )
-            if created:
-                self.stdout.write(f"Created InsuranceProvider: {p['name']}")
 
     def seed_shops(self):
         """Seed real Speedy Glass locations with geocoded coordinates."""
-        # All 28 Speedy Glass locations from speedy-locations.md
-        # Coordinates are pre-geocoded (longitude, latitude) for PostGIS Point
-        shops_data: List[Dict[str, Any]] = [
-            # === ALASKA (6 Locations) ===
-            {
-                "name": "Speedy Glass Anchorage (Brayton Dr)",
-                "street_address": "6511 Brayton Dr",
-                "city": "Anchorage",
-                "state": "AK",
-                "postal_code": "99507",
-                "phone": "(907) 272-1435",
-                "email": "anchorage.brayton@speedyglass.com",
-                "location": Point(-149.8631, 61.1508),
-            },
-            {
-                "name": "Speedy Glass Anchorage (East 5th)",
-                "street_address": "901 E 5th Ave",
-                "city": "Anchorage",
-                "state": "AK",
-                "postal_code": "99501",
-                "phone": "(907) 274-5509",
-                "email": "anchorage.5th@speedyglass.com",
-                "location": Point(-149.8697, 61.2181),
-            },
-            {
-                "name": "Speedy Glass Anchorage (Huffman)",
-                "street_address": "1215 Huffman Rd",
-                "city": "Anchorage",
-                "state": "AK",
-                "postal_code": "99515",
-                "phone": "(907) 345-2343",
-                "email": "anchorage.huffman@speedyglass.com",
-                "location": Point(-149.8583, 61.1083),
-            },
-            {
-                "name": "Speedy Glass Eagle River",
-                "street_address": "12108 Business Blvd",
-                "city": "Eagle River",
-                "state": "AK",
-                "postal_code": "99577",
-                "phone": "(907) 694-7640",
-                "email": "eagleriver@speedyglass.com",
-                "location": Point(-149.5683, 61.3214),
-            },
-            {
-                "name": "Speedy Glass Fairbanks",
-                "street_address": "2206 Discovery Dr",
-                "city": "Fairbanks",
-                "state": "AK",
-                "postal_code": "99709",
-                "phone": "(907) 456-2777",
-                "email": "fairbanks@speedyglass.com",
-                "location": Point(-147.8761, 64.8401),
-            },
-            {
-                "name": "Speedy Glass Wasilla",
-                "street_address": "935 Commercial Dr",
-                "city": "Wasilla",
-                "state": "AK",
-                "postal_code": "99654",
-                "phone": "(907) 376-3251",
-                "email": "wasilla@speedyglass.com",
-                "location": Point(-149.4372, 61.5814),
-            },
-            # === ARIZONA (1 Location) ===
-            {
-                "name": "Speedy Glass Tucson",
-                "street_address": "120 S Kolb Rd",
-                "city": "Tucson",
-                "state": "AZ",
-                "postal_code": "85710",
-                "phone": "(520) 296-7171",
-                "email": "tucson@speedyglass.com",
-                "location": Point(-110.8128, 32.2217),
-            },
-            # === COLORADO (1 Location) ===
-            {
-                "name": "Speedy Glass Denver (Englewood)",
-                "street_address": "4700 S Broadway",
-                "city": "Englewood",
-                "state": "CO",
-                "postal_code": "80113",
-                "phone": "(303) 635-6863",
-                "email": "denver@speedyglass.com",
-                "location": Point(-104.9875, 39.6478),
-            },
-            # === MONTANA (4 Locations) ===
-            {
-                "name": "Speedy Glass Billings",
-                "street_address": "3207 Montana Ave",
-                "city": "Billings",
-                "state": "MT",
-                "postal_code": "59101",
-                "phone": "(406) 248-3605",
-                "email": "billings@speedyglass.com",
-                "location": Point(-108.5007, 45.7833),
-            },
-            {
-                "name": "Speedy Glass Bozeman",
-                "street_address": "1022 N 7th Ave",
-                "city": "Bozeman",
-                "state": "MT",
-                "postal_code": "59715",
-                "phone": "(406) 587-5575",
-                "email": "bozeman@speedyglass.com",
-                "location": Point(-111.0429, 45.6878),
-            },
-            {
-                "name": "Speedy Glass Great Falls",
-                "street_address": "2125 10th Ave S",
-                "city": "Great Falls",
-                "state": "MT",
-                "postal_code": "59405",
-                "phone": "(406) 727-8642",
-                "email": "greatfalls@speedyglass.com",
-                "location": Point(-111.2833, 47.4942),
-            },
-            {
-                "name": "Speedy Glass Helena",
-                "street_address": "1521 N Montana Ave",
-                "city": "Helena",
-                "state": "MT",
-                "postal_code": "59601",
-                "phone": "(406) 442-2489",
-                "email": "helena@speedyglass.com",
-                "location": Point(-112.0391, 46.5958),
-            },
-            # === NEW MEXICO (3 Locations) ===
-            {
-                "name": "Speedy Glass Albuquerque",
-                "street_address": "9626 Menaul Blvd NE",
-                "city": "Albuquerque",
-                "state": "NM",
-                "postal_code": "87112",
-                "phone": "(505) 294-7006",
-                "email": "albuquerque@speedyglass.com",
-                "location": Point(-106.5642, 35.0972),
-            },
-            {
-                "name": "Speedy Glass Las Cruces",
-                "street_address": "455 Foster Rd",
-                "city": "Las Cruces",
-                "state": "NM",
-                "postal_code": "88005",
-                "phone": "(575) 526-9571",
-                "email": "lascruces@speedyglass.com",
-                "location": Point(-106.7893, 32.3199),
-            },
-            {
-                "name": "Speedy Glass Santa Fe",
-                "street_address": "3202 Calle Marie",
-                "city": "Santa Fe",
-                "state": "NM",
-                "postal_code": "87507",
-                "phone": "(505) 982-4373",
-                "email": "santafe@speedyglass.com",
-                "location": Point(-105.9378, 35.6619),
-            },
-            # === OREGON (3 Locations) ===
-            {
-                "name": "Speedy Glass Milwaukie",
-                "street_address": "16669 SE McLoughlin Blvd",
-                "city": "Milwaukie",
-                "state": "OR",
-                "postal_code": "97267",
-                "phone": "(503) 252-1439",
-                "email": "milwaukie@speedyglass.com",
-                "location": Point(-122.6289, 45.4151),
-            },
-            {
-                "name": "Speedy Glass Portland (Broadway)",
-                "street_address": "1804 NE Broadway",
-                "city": "Portland",
-                "state": "OR",
-                "postal_code": "97232",
-                "phone": "(503) 288-5964",
-                "email": "portland@speedyglass.com",
-                "location": Point(-122.6425, 45.5347),
-            },
-            {
-                "name": "Speedy Glass Salem",
-                "street_address": "1085 13th St SE",
-                "city": "Salem",
-                "state": "OR",
-                "postal_code": "97302",
-                "phone": "(503) 371-1777",
-                "email": "salem@speedyglass.com",
-                "location": Point(-122.9983, 44.9296),
-            },
-            # === WASHINGTON (9 Locations) ===
-            {
-                "name": "Speedy Glass Auburn",
-                "street_address": "1801 Auburn Way North",
-                "city": "Auburn",
-                "state": "WA",
-                "postal_code": "98002",
-                "phone": "(253) 604-2563",
-                "email": "auburn@speedyglass.com",
-                "location": Point(-122.2165, 47.3245),
-            },
-            {
-                "name": "Speedy Glass Bothell",
-                "street_address": "18206 Bothell Way NE",
-                "city": "Bothell",
-                "state": "WA",
-                "postal_code": "98011",
-                "phone": "(425) 486-1032",
-                "email": "bothell@speedyglass.com",
-                "location": Point(-122.2015, 47.7623),
-            },
-            {
-                "name": "Speedy Glass Federal Way",
-                "street_address": "32610 Pacific Hwy S",
-                "city": "Federal Way",
-                "state": "WA",
-                "postal_code": "98003",
-                "phone": "(253) 838-8838",
-                "email": "federalway@speedyglass.com",
-                "location": Point(-122.3126, 47.3043),
-            },
-            {
-                "name": "Speedy Glass Gig Harbor",
-                "street_address": "3720 Harborview Dr",
-                "city": "Gig Harbor",
-                "state": "WA",
-                "postal_code": "98332",
-                "phone": "(253) 851-8496",
-                "email": "gigharbor@speedyglass.com",
-                "location": Point(-122.5801, 47.3290),
-            },
-            {
-                "name": "Speedy Glass Kennewick",
-                "street_address": "5623 West Clearwater Avenue",
-                "city": "Kennewick",
-                "state": "WA",
-                "postal_code": "99336",
-                "phone": "(509) 783-3500",
-                "email": "kennewick@speedyglass.com",
-                "location": Point(-119.2369, 46.2112),
-            },
-            {
-                "name": "Speedy Glass Puyallup",
-                "street_address": "12623 Meridian Ave E",
-                "city": "Puyallup",
-                "state": "WA",
-                "postal_code": "98373",
-                "phone": "(253) 848-4400",
-                "email": "puyallup@speedyglass.com",
-                "location": Point(-122.2929, 47.1301),
-            },
-            {
-                "name": "Speedy Glass Seattle",
-                "street_address": "12813 Aurora Avenue North",
-                "city": "Seattle",
-                "state": "WA",
-                "postal_code": "98133",
-                "phone": "(206) 522-1707",
-                "email": "seattle@speedyglass.com",
-                "location": Point(-122.3450, 47.7265),
-            },
-            {
-                "name": "Speedy Glass Tacoma",
-                "street_address": "4708 S Tacoma Way",
-                "city": "Tacoma",
-                "state": "WA",
-                "postal_code": "98409",
-                "phone": "(253) 474-0784",
-                "email": "tacoma@speedyglass.com",
-                "location": Point(-122.4713, 47.2095),
-            },
-            {
-                "name": "Speedy Glass Vancouver",
-                "street_address": "1905 East 5th Suite A,B,C,D",
-                "city": "Vancouver",
-                "state": "WA",
-                "postal_code": "98661",
-                "phone": "(971) 416-8977",
-                "email": "vancouver@speedyglass.com",
-                "location": Point(-122.6265, 45.6387),
-            },
-        ]
-
-        created_count = 0
-        for shop_data in shops_data:
-            shop, created = Shop.objects.get_or_create(
-                name=shop_data["name"], defaults=shop_data
+        shops = load_shops()
+        names = [row["name"] for row in shops]
+        existing = set(
+            Shop.objects.filter(name__in=names).values_list("name", flat=True)
+        )
+        new_shops = Shop.objects.bulk_create(
+            [
+                Shop(
+                    name=row["name"],
+                    street_address=row["street_address"],
+                    city=row["city"],
+                    state=row["state"],
+                    postal_code=row["postal_code"],
+                    phone=row["phone"],
+                    email=row["email"],
+                    location=_mkpt(float(row["lon"]), float(row["lat"])),
+                )
+                for row in shops
+                if row["name"] not in existing
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        if new_shops:
+            self.stdout.write(
+                "\n".join(f"Created Shop: {shop.name}" for shop in new_shops)
             )
-            if created:
-                created_count += 1
-                self.stdout.write(f"Created Shop: {shop_data['name']}")
 
-                # Create service area for the shop's postal code
-                ServiceArea.objects.get_or_create(
-                    shop=shop, postal_code=shop_data["postal_code"]
+        # Ensure every seeded shop covers its own postal code. The
+        # (shop, postal_code) unique constraint turns this into one
+        # ON CONFLICT DO NOTHING insert, which also backfills areas for
+        # shops that were seeded before.
+        id_by_name = dict(
+            Shop.objects.filter(name__in=names).values_list("name", "id")
+        )
+        ServiceArea.objects.bulk_create(
+            [
+                ServiceArea(
+                    shop_id=id_by_name[row["name"]], postal_code=row["postal_code"]
                 )
+                for row in shops
+            ],
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True,
+        )
 
-        self.stdout.write(f"Created {created_count} new shops (28 total locations)")
+        self.stdout.write(
+            f"Created {len(new_shops)} new shops ({len(shops)} total locations)"
+        )
 
     def seed_pricing_profiles(self):
         """Create a default PricingProfile for each shop."""
-        shops = Shop.objects.all()
+        shops_with_default = set(
+            PricingProfile.objects.filter(is_default=True).values_list(
+                "shop_id", flat=True
+            )
+        )
         created_count = 0
+        batch = []
+        lines = []
 
-        for shop in shops:
-            # Check if shop already has a default profile
-            if not PricingProfile.objects.filter(shop=shop, is_default=True).exists():
-                PricingProfile.objects.create(
+        # Stream shops in chunks and flush profiles per batch so memory stays
+        # bounded as the shop network grows. Only id and name are needed;
+        # skip the other columns and the geometry parse for each row.
+        shops = Shop.objects.values_list("id", "name").iterator(chunk_size=BATCH_SIZE)
+        for shop_id, name in shops:
+            if shop_id in shops_with_default:
+                continue
+            batch.append(
+                PricingProfile(
                     name="Standard Pricing",
-                    shop=shop,
+                    shop_id=shop_id,
                     is_default=True,
                     is_active=True,
                     # All other fields use model defaults
                 )
-                created_count += 1
-                self.stdout.write(f"Created PricingProfile for: {shop.name}")
+            )
+            lines.append(f"Created PricingProfile for: {name}")
+            if len(batch) >= BATCH_SIZE:
+                PricingProfile.objects.bulk_create(batch)
+                created_count += len(batch)
+                batch = []
+
+        if batch:
+            PricingProfile.objects.bulk_create(batch)
+            created_count += len(batch)
 
-        self.stdout.write(f"Created {created_count} pricing profiles")
+        lines.append(f"Created {created_count} pricing profiles")
+        self.stdout.write("\n".join(lines))
@@ -1,13 +1,21 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import Group
+from django.db.models import Q
 
 User = get_user_model()
 
+SEED_PASSWORD = "password123"
+# Every seeded staff user shares one password, so hash it once at import
+_SEED_PASSWORD_HASH = make_password(SEED_PASSWORD)
+
 
 class Command(BaseCommand):
     help = "Creates staff users for CSR dashboard (CSRs, Division Managers, Network Managers)"
 
+    @transaction.atomic
     def handle(self, *args, **options):
         # Ensure Support Agent group exists
         support_group, created = Group.objects.get_or_create(name="Support Agent")
@@ -19,7 +27,6 @@ class Command(BaseCommand):
             {
                 "username": "csr1",
                 "email": "csr1@speedy.com",
-                "password": "password123",
                 "first_name": "Carlos",
                 "last_name": "Rodriguez",
                 "is_staff": False,
@@ -29,7 +36,6 @@ class Command(BaseCommand):
             {
                 "username": "csr2",
                 "email": "csr2@speedy.com",
-                "password": "password123",
                 "first_name": "Sarah",
                 "last_name": "Johnson",
                 "is_staff": False,
@@ -39,7 +45,6 @@ class Command(BaseCommand):
             {
                 "username": "csr3",
                 "email": "csr3@speedy.com",
-                "password": "password123",
                 "first_name": "Mike",
                 "last_name": "Chen",
                 "is_staff": False,
@@ -50,7 +55,6 @@ class Command(BaseCommand):
             {
                 "username": "dm1",
                 "email": "dm1@speedy.com",
-                "password": "password123",
                 "first_name": "David",
                 "last_name": "Martinez",
                 "is_staff": True,
@@ -60,7 +64,6 @@ class Command(BaseCommand):
             {
                 "username": "dm2",
                 "email": "dm2@speedy.com",
-                "password": "password123",
                 "first_name": "Emily",
                 "last_name": "Thompson",
                 "is_staff": True,
@@ -71,7 +74,6 @@ class Command(BaseCommand):
             {
                 "username": "nm1",
                 "email": "nm1@speedy.com",
-                "password": "password123",
                 "first_name": "Robert",
                 "last_name": "Wilson",
                 "is_staff": True,
@@ -80,31 +82,57 @@ class Command(BaseCommand):
             },
         ]
 
-        created_count = 0
+        # Collect output and write it in one go at the end
+        lines = []
+
+        # Load every conflicting username/email in one query
+        existing = User.objects.filter(
+            Q(username__in=[u["username"] for u in users])
+            | Q(email__in=[u["email"] for u in users])
+        ).values_list("username", "email")
+        existing_usernames = set()
+        existing_emails = set()
+        for username, email in existing:
+            existing_usernames.add(username)
+            existing_emails.add(email)
+
+        to_create = []
         for user_data in users:
             username: str = user_data["username"]
             email: str = user_data["email"]
 
             # Check if user exists by email or username
-            if User.objects.filter(username=username).exists():
-                self.stdout.write(f"User exists: {username}")
+            if username in existing_usernames:
+                lines.append(f"User exists: {username}")
                 continue
 
-            if User.objects.filter(email=email).exists():
-                self.stdout.write(f"Email exists: {email}")
+            if email in existing_emails:
+                lines.append(f"Email exists: {email}")
                 continue
 
-            user = User.objects.create_user(
-                username=username,
-                email=email,
-                password=user_data["password"],
-                first_name=user_data.get("first_name", ""),
-                last_name=user_data.get("last_name", ""),
-                is_staff=user_data["is_staff"],
-                is_superuser=user_data["is_superuser"],
-            )
-            created_count += 1
+            to_create.append(user_data)
+
+        created_users = User.objects.bulk_create(
+            [
+                User(
+                    username=user_data["username"],
+                    email=User.objects.normalize_email(user_data["email"]),
+                    password=_SEED_PASSWORD_HASH,
+                    first_name=user_data.get("first_name", ""),
+                    last_name=user_data.get("last_name", ""),
+                    is_staff=user_data["is_staff"],
+                    is_superuser=user_data["is_superuser"],
+                )
+                for user_data in to_create
+            ]
+        )
+        created_count = len(created_users)
+
+        # Resolve every referenced group once, outside the user loop
+        group_names = {name for u in to_create for name in u.get("groups", [])}
+        groups_by_name = {g.name: g for g in Group.objects.filter(name__in=group_names)}
 
+        for user, user_data in zip(created_users, to_create):
             # Determine role for display
             if user_data["is_superuser"]:
                 role = "Network Manager"
@@ -113,27 +141,38 @@ class Command(BaseCommand):
             else:
                 role = "CSR"
 
-            self.stdout.write(
-                self.style.SUCCESS(f"Created {role}: {username} ({email})")
+            lines.append(
+                self.style.SUCCESS(f"Created {role}: {user.username} ({user.email})")
             )
 
             # Assign groups
             for group_name in user_data.get("groups", []):
-                try:
-                    group = Group.objects.get(name=group_name)
-                    user.groups.add(group)
-                    self.stdout.write(f"  -> Added to group: {group_name}")
-                except Group.DoesNotExist:
-                    self.stdout.write(
+                if group_name not in groups_by_name:
+                    lines.append(
                         self.style.WARNING(f"  -> Group not found: {group_name}")
                     )
+                    continue
+                lines.append(f"  -> Added to group: {group_name}")
 
-        self.stdout.write("")
-        self.stdout.write(
+        Membership = User.groups.through
+        Membership.objects.bulk_create(
+            (
+                Membership(user_id=user.pk, group_id=groups_by_name[name].pk)
+                for user, user_data in zip(created_users, to_create)
+                for name in user_data.get("groups", [])
+                if name in groups_by_name
+            ),
+            ignore_conflicts=True,
+        )
+
+        lines.append("")
+        lines.append(
             self.style.SUCCESS(f"Done! Created {created_count} new staff users.")
         )
-        self.stdout.write("")
-        self.stdout.write("Login credentials (all use password123):")
-        self.stdout.write("  CSRs:             csr1@speedy.com, csr2@speedy.com, csr3@speedy.com")
-        self.stdout.write("  Division Managers: dm1@speedy.com, dm2@speedy.com")
-        self.stdout.write("  Network Manager:   nm1@speedy.com")
+        lines.append("")
+        lines.append(f"Login credentials (all use {SEED_PASSWORD}):")
+        lines.append("  CSRs:             csr1@speedy.com, csr2@speedy.com, csr3@speedy.com")
+        lines.append("  Division Managers: dm1@speedy.com, dm2@speedy.com")
+        lines.append("  Network Manager:   nm1@speedy.com")
+
+        self.stdout.write("\n".join(lines))
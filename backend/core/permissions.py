@@ -2,8 +2,46 @@
 Custom permission classes for role-based access control.
 """
 
+from django.core.cache import cache
 from rest_framework.permissions import BasePermission
 
+SUPPORT_AGENT_GROUP = "Support Agent"
+
+# Support Agent membership per user id, kept in the shared cache so the
+# invalidation in core.signals reaches every worker as soon as membership
+# changes.
+MEMBERSHIP_CACHE_TIMEOUT = 300
+
+
+def support_agent_membership_cache_key(user_id):
+    return f"perm:support_agent:{user_id}"
+
+
+def user_is_support_agent(user):
+    """
+    Return whether the user is in the 'Support Agent' group.
+
+    The answer is memoized on the user instance, so repeated checks in one
+    request (permission classes, serializers) share a single query. Uses
+    prefetched groups when available, then the shared membership cache,
+    and otherwise a single EXISTS query on the group name.
+    """
+    try:
+        return user._is_support_agent
+    except AttributeError:
+        pass
+
+    if "groups" in getattr(user, "_prefetched_objects_cache", {}):
+        is_support = any(g.name == SUPPORT_AGENT_GROUP for g in user.groups.all())
+    else:
+        cache_key = support_agent_membership_cache_key(user.pk)
+        is_support = cache.get(cache_key)
+        if is_support is None:
+            is_support = user.groups.filter(name=SUPPORT_AGENT_GROUP).exists()
+            cache.set(cache_key, is_support, MEMBERSHIP_CACHE_TIMEOUT)
+    user._is_support_agent = is_support
+    return is_support
+
 
 class IsSupportAgent(BasePermission):
     """
@@ -13,7 +51,7 @@ class IsSupportAgent(BasePermission):
     def has_permission(self, request, view):
         if not request.user or not request.user.is_authenticated:
             return False
-        return request.user.groups.filter(name="Support Agent").exists()
+        return user_is_support_agent(request.user)
 
 
 class IsSupportOrAdmin(BasePermission):
@@ -24,10 +62,7 @@ class IsSupportOrAdmin(BasePermission):
     def has_permission(self, request, view):
         if not request.user or not request.user.is_authenticated:
             return False
-        return (
-            request.user.is_staff
-            or request.user.groups.filter(name="Support Agent").exists()
-        )
+        return request.user.is_staff or user_is_support_agent(request.user)
 
 
 class IsCustomerOwner(BasePermission):
@@ -40,10 +75,7 @@ class IsCustomerOwner(BasePermission):
             return False
 
         # Admin and support agents can access all
-        if (
-            request.user.is_staff
-            or request.user.groups.filter(name="Support Agent").exists()
-        ):
+        if request.user.is_staff or user_is_support_agent(request.user):
             return True
 
         # Check if object has a customer attribute and matches the user
@@ -1,8 +1,19 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from core.permissions import user_is_support_agent
 
 User = get_user_model()
 
+# Serialized /me/ payloads are cached per user. The key embeds the tail of
+# the password hash so a credential change naturally rotates it.
+USER_PAYLOAD_CACHE_TIMEOUT = 300
+
+
+def user_payload_cache_key(user_id, password):
+    return f"user:me:{user_id}:{password[-8:]}"
+
 
 class TimestampedSerializer(serializers.Serializer):
     created_at = serializers.DateTimeField(read_only=True)
@@ -39,19 +50,47 @@ class UserSerializer(serializers.ModelSerializer):
     def get_role(self, obj):
         """
         Determine user role based on groups and staff status.
+
+        Memoized on the user instance, since the same user can appear
+        several times in one response.
         """
+        try:
+            return obj._cached_role
+        except AttributeError:
+            pass
+
         if obj.is_superuser:
-            return "admin"
-        elif obj.groups.filter(name="Support Agent").exists():
-            return "support_agent"
+            role = "admin"
+        elif user_is_support_agent(obj):
+            role = "support_agent"
         else:
-            return "customer"
+            role = "customer"
+        obj._cached_role = role
+        return role
 
     def get_permissions(self, obj):
         """
         Return list of permission codenames for the user.
+
+        Reads through user_permissions.all() so querysets that
+        prefetch_related("user_permissions", "groups") serialize without a
+        query per user.
         """
-        return list(obj.user_permissions.values_list("codename", flat=True))
+        return [perm.codename for perm in obj.user_permissions.all()]
+
+
+def get_user_payload(user):
+    """
+    Return UserSerializer data for a user, served from and stored in cache.
+
+    Shared by login and /me/ so a fresh login warms the /me/ cache.
+    """
+    cache_key = user_payload_cache_key(user.pk, user.password)
+    data = cache.get(cache_key)
+    if data is None:
+        data = UserSerializer(user).data
+        cache.set(cache_key, data, USER_PAYLOAD_CACHE_TIMEOUT)
+    return data
 
 
 class LoginSerializer(serializers.Serializer):
@@ -6,19 +6,34 @@ class BaseService:
     """
     Base class for all services.
     Provides common functionality like logging.
+
+    The log_* helpers take %-style args like the logging module, so the
+    message is only formatted if the record is actually emitted.
     """
 
-    def __init__(self):
-        self.logger = logging.getLogger(f"{self.__module__}.{self.__class__.__name__}")
+    logger = logging.getLogger(f"{__name__}.BaseService")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolve the logger once per class rather than per instance
+        cls.logger = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
 
-    def log_info(self, message: str, extra: Optional[Dict[str, Any]] = None):
-        self.logger.info(message, extra=extra)
+    def log_info(
+        self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None
+    ):
+        self.logger.info(message, *args, extra=extra)
 
-    def log_error(self, message: str, extra: Optional[Dict[str, Any]] = None):
-        self.logger.error(message, extra=extra)
+    def log_error(
+        self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None
+    ):
+        self.logger.error(message, *args, extra=extra)
 
-    def log_warning(self, message: str, extra: Optional[Dict[str, Any]] = None):
-        self.logger.warning(message, extra=extra)
+    def log_warning(
+        self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None
+    ):
+        self.logger.warning(message, *args, extra=extra)
 
-    def log_debug(self, message: str, extra: Optional[Dict[str, Any]] = None):
-        self.logger.debug(message, extra=extra)
+    def log_debug(
+        self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None
+    ):
+        self.logger.debug(message, *args, extra=extra)
@@ -1,8 +1,11 @@
+import base64
 import secrets
 import hashlib
 import logging
+from functools import lru_cache
+from typing import Tuple
 from post_office import mail
-from django.template.loader import render_to_string
+from django.template.loader import get_template, render_to_string
 from django.conf import settings
 from django.utils import timezone
 from core.services.base_service import BaseService
@@ -10,10 +13,33 @@ from quotes.models import Quote
 
 logger = logging.getLogger(__name__)
 
+APPROVAL_TOKEN_FIELDS = ["approval_token_hash", "approval_token_created_at"]
+
+
+@lru_cache(maxsize=None)
+def _get_email_template(template_name):
+    return get_template(template_name)
+
+
+def render_email(template_name, context):
+    """
+    Render an email template, resolving it through the loaders only once.
+
+    In DEBUG the template is looked up on every call so edits show up
+    without restarting the process.
+    """
+    if settings.DEBUG:
+        return render_to_string(template_name, context)
+    return _get_email_template(template_name).render(context)
+
 
 class EmailService(BaseService):
     """
     Service for handling email communications.
+
+    Every send reads quote.customer, and some templates read quote.shop.
+    Pass quotes loaded with select_related("customer", "shop") so those
+    reads don't each issue a query.
     """
 
     def send_quote_received(self, quote: Quote) -> bool:
@@ -22,98 +48,49 @@ class EmailService(BaseService):
         No approval link - just sets expectations.
         """
         try:
-            vehicle_desc = (
-                f"{quote.vehicle_info.get('year')} "
-                f"{quote.vehicle_info.get('make')} "
-                f"{quote.vehicle_info.get('model')}"
-            )
-
-            context = {
-                "quote": quote,
-                "vehicle_desc": vehicle_desc,
-                "customer_name": quote.customer.first_name,
-            }
-
-            html_message = render_to_string("emails/quote_received.html", context)
-            subject = f"We've Received Your Auto Glass Quote Request - {vehicle_desc}"
-
-            mail.send(
-                recipients=[quote.customer.email],
-                sender=settings.DEFAULT_FROM_EMAIL,
-                subject=subject,
-                message=(
-                    f"Thanks for your request! We're reviewing your quote "
-                    f"for {vehicle_desc} and will send you pricing shortly."
-                ),
-                html_message=html_message,
-                priority="now",
-            )
+            mail.send(**self._build_quote_received_email(quote))
 
             self.log_info(
-                f"Quote received email sent to {quote.customer.email} "
-                f"for quote {quote.id}"
+                "Quote received email sent to %s for quote %s",
+                quote.customer.email,
+                quote.id,
             )
             return True
 
         except Exception as e:
             self.log_error(
-                f"Failed to send quote received email for {quote.id}: {str(e)}"
+                "Failed to send quote received email for %s: %s", quote.id, e
             )
             return False
 
     def send_quote(self, quote: Quote) -> bool:
         """
         Generates a secure token, updates the quote, and sends the quote email.
+
+        Reads quote.customer and quote.shop; load the quote with
+        select_related("customer", "shop") to avoid extra queries.
         """
         try:
-            # Generate secure token
-            token = self.generate_secure_token()
-            token_hash = self.hash_token(token)
-
-            # Update quote with token hash
-            quote.approval_token_hash = token_hash
-            quote.approval_token_created_at = timezone.now()
-            quote.save(
-                update_fields=["approval_token_hash", "approval_token_created_at"]
-            )
-
-            # Build context
-            vehicle_desc = (
-                f"{quote.vehicle_info.get('year')} "
-                f"{quote.vehicle_info.get('make')} "
-                f"{quote.vehicle_info.get('model')}"
-            )
-            # Use frontend URL from settings - links to quote view page
-            approval_link = f"{settings.FRONTEND_URL}/quote/{quote.id}"
-
-            context = {
-                "quote": quote,
-                "vehicle_desc": vehicle_desc,
-                "line_items": quote.line_items.all(),
-                "approval_link": approval_link,
-            }
-
-            html_message = render_to_string("emails/quote_email.html", context)
-            subject = f"Your Auto Glass Quote - {vehicle_desc}"
-
-            mail.send(
-                recipients=[quote.customer.email],
-                sender=settings.DEFAULT_FROM_EMAIL,
-                subject=subject,
-                message=f"Please view your quote here: {approval_link}",  # Fallback
-                html_message=html_message,
-                priority="now",
-            )
+            self._issue_approval_token(quote)
+            quote.save(update_fields=APPROVAL_TOKEN_FIELDS)
+            mail.send(**self._build_quote_email(quote))
 
             self.log_info(
-                f"Quote email sent to {quote.customer.email} for quote {quote.id}"
+                "Quote email sent to %s for quote %s", quote.customer.email, quote.id
             )
             return True
 
         except Exception as e:
-            self.log_error(f"Failed to send quote email for {quote.id}: {str(e)}")
+            self.log_error("Failed to send quote email for %s: %s", quote.id, e)
             return False
 
+    def _issue_approval_token(self, quote: Quote) -> None:
+        """
+        Sets a fresh approval token hash on the quote without saving it.
+        """
+        _, quote.approval_token_hash = self.generate_secure_token()
+        quote.approval_token_created_at = timezone.now()
+
     def send_quote_pending_review(self, quote: Quote) -> bool:
         """
         Sends email when quote needs CSR review.
@@ -122,44 +99,18 @@ class EmailService(BaseService):
         multiple parts, missing calibration data, etc.).
         """
         try:
-            vehicle_desc = (
-                f"{quote.vehicle_info.get('year')} "
-                f"{quote.vehicle_info.get('make')} "
-                f"{quote.vehicle_info.get('model')}"
-            )
-
-            context = {
-                "quote": quote,
-                "vehicle_desc": vehicle_desc,
-                "customer_name": quote.customer.first_name,
-            }
-
-            html_message = render_to_string(
-                "emails/quote_pending_review.html", context
-            )
-            subject = f"We're Reviewing Your Quote Request - {vehicle_desc}"
-
-            mail.send(
-                recipients=[quote.customer.email],
-                sender=settings.DEFAULT_FROM_EMAIL,
-                subject=subject,
-                message=(
-                    f"We're reviewing your quote for {vehicle_desc}. "
-                    "An agent will be in touch shortly."
-                ),
-                html_message=html_message,
-                priority="now",
-            )
+            mail.send(**self._build_pending_review_email(quote))
 
             self.log_info(
-                f"Pending review email sent to {quote.customer.email} "
-                f"for quote {quote.id}"
+                "Pending review email sent to %s for quote %s",
+                quote.customer.email,
+                quote.id,
             )
             return True
 
         except Exception as e:
             self.log_error(
-                f"Failed to send pending review email for {quote.id}: {str(e)}"
+                "Failed to send pending review email for %s: %s", quote.id, e
             )
             return False
 
@@ -168,37 +119,17 @@ class EmailService(BaseService):
         Sends a rejection email.
         """
         try:
-            vehicle_desc = (
-                f"{quote.vehicle_info.get('year')} "
-                f"{quote.vehicle_info.get('make')} "
-                f"{quote.vehicle_info.get('model')}"
-            )
-
-            context = {
-                "quote": quote,
-                "vehicle_desc": vehicle_desc,
-                "reason": reason,
-            }
-
-            html_message = render_to_string("emails/rejection_email.html", context)
-            subject = f"Update on Your Quote Request - {vehicle_desc}"
-
-            mail.send(
-                recipients=[quote.customer.email],
-                sender=settings.DEFAULT_FROM_EMAIL,
-                subject=subject,
-                message=f"Your quote request could not be processed. Reason: {reason}",
-                html_message=html_message,
-                priority="now",
-            )
+            mail.send(**self._build_rejection_email(quote, reason))
 
             self.log_info(
-                f"Rejection email sent to {quote.customer.email} for quote {quote.id}"
+                "Rejection email sent to %s for quote %s",
+                quote.customer.email,
+                quote.id,
             )
             return True
 
         except Exception as e:
-            self.log_error(f"Failed to send rejection email for {quote.id}: {str(e)}")
+            self.log_error("Failed to send rejection email for %s: %s", quote.id, e)
             return False
 
     def send_approval_confirmation(self, quote: Quote) -> bool:
@@ -206,56 +137,139 @@ class EmailService(BaseService):
         Sends an approval confirmation email.
         """
         try:
-            vehicle_desc = (
-                f"{quote.vehicle_info.get('year')} "
-                f"{quote.vehicle_info.get('make')} "
-                f"{quote.vehicle_info.get('model')}"
-            )
-            scheduling_link = f"{settings.FRONTEND_URL}/schedule"
-
-            context = {
-                "quote": quote,
-                "vehicle_desc": vehicle_desc,
-                "scheduling_link": scheduling_link,
-            }
-
-            html_message = render_to_string(
-                "emails/approval_confirmation.html", context
-            )
-            subject = f"Quote Approved - Next Steps for your {vehicle_desc}"
-
-            mail.send(
-                recipients=[quote.customer.email],
-                sender=settings.DEFAULT_FROM_EMAIL,
-                subject=subject,
-                message=(
-                    "Your quote has been approved! " "Please schedule your appointment."
-                ),
-                html_message=html_message,
-                priority="now",
-            )
+            mail.send(**self._build_approval_confirmation_email(quote))
 
             self.log_info(
-                f"Approval confirmation email sent to {quote.customer.email} "
-                f"for quote {quote.id}"
+                "Approval confirmation email sent to %s for quote %s",
+                quote.customer.email,
+                quote.id,
             )
             return True
 
         except Exception as e:
             self.log_error(
-                f"Failed to send approval confirmation email for "
-                f"{quote.id}: {str(e)}"
+                "Failed to send approval confirmation email for %s: %s", quote.id, e
             )
             return False
 
-    def generate_secure_token(self) -> str:
+    # Each _build_*_email renders one email and returns the keyword
+    # arguments for post_office's mail.send.
+
+    def _build_quote_received_email(self, quote: Quote) -> dict:
+        vehicle_desc = quote.vehicle_desc
+
+        context = {
+            "quote": quote,
+            "vehicle_desc": vehicle_desc,
+            "customer_name": quote.customer.first_name,
+        }
+
+        return {
+            "recipients": [quote.customer.email],
+            "sender": settings.DEFAULT_FROM_EMAIL,
+            "subject": (
+                f"We've Received Your Auto Glass Quote Request - {vehicle_desc}"
+            ),
+            "message": (
+                f"Thanks for your request! We're reviewing your quote "
+                f"for {vehicle_desc} and will send you pricing shortly."
+            ),
+            "html_message": render_email("emails/quote_received.html", context),
+        }
+
+    def _build_quote_email(self, quote: Quote) -> dict:
+        vehicle_desc = quote.vehicle_desc
+        # Use frontend URL from settings - links to quote view page
+        approval_link = f"{settings.FRONTEND_URL}/quote/{quote.id}"
+
+        context = {
+            "quote": quote,
+            "vehicle_desc": vehicle_desc,
+            "approval_link": approval_link,
+        }
+
+        return {
+            "recipients": [quote.customer.email],
+            "sender": settings.DEFAULT_FROM_EMAIL,
+            "subject": f"Your Auto Glass Quote - {vehicle_desc}",
+            "message": f"Please view your quote here: {approval_link}",  # Fallback
+            "html_message": render_email("emails/quote_email.html", context),
+        }
+
+    def _build_pending_review_email(self, quote: Quote) -> dict:
+        vehicle_desc = quote.vehicle_desc
+
+        context = {
+            "quote": quote,
+            "vehicle_desc": vehicle_desc,
+            "customer_name": quote.customer.first_name,
+        }
+
+        return {
+            "recipients": [quote.customer.email],
+            "sender": settings.DEFAULT_FROM_EMAIL,
+            "subject": f"We're Reviewing Your Quote Request - {vehicle_desc}",
+            "message": (
+                f"We're reviewing your quote for {vehicle_desc}. "
+                "An agent will be in touch shortly."
+            ),
+            "html_message": render_email("emails/quote_pending_review.html", context),
+        }
+
+    def _build_rejection_email(self, quote: Quote, reason: str) -> dict:
+        vehicle_desc = quote.vehicle_desc
+
+        context = {
+            "quote": quote,
+            "vehicle_desc": vehicle_desc,
+            "reason": reason,
+        }
+
+        return {
+            "recipients": [quote.customer.email],
+            "sender": settings.DEFAULT_FROM_EMAIL,
+            "subject": f"Update on Your Quote Request - {vehicle_desc}",
+            "message": f"Your quote request could not be processed. Reason: {reason}",
+            "html_message": render_email("emails/rejection_email.html", context),
+        }
+
+    def _build_approval_confirmation_email(self, quote: Quote) -> dict:
+        vehicle_desc = quote.vehicle_desc
+        scheduling_link = f"{settings.FRONTEND_URL}/schedule"
+
+        context = {
+            "quote": quote,
+            "vehicle_desc": vehicle_desc,
+            "scheduling_link": scheduling_link,
+        }
+
+        return {
+            "recipients": [quote.customer.email],
+            "sender": settings.DEFAULT_FROM_EMAIL,
+            "subject": f"Quote Approved - Next Steps for your {vehicle_desc}",
+            "message": (
+                "Your quote has been approved! " "Please schedule your appointment."
+            ),
+            "html_message": render_email("emails/approval_confirmation.html", context),
+        }
+
+    def generate_secure_token(self) -> Tuple[str, str]:
         """
-        Generates a cryptographically secure URL-safe token.
+        Generates a cryptographically secure URL-safe token and its hash.
+
+        Same token format as secrets.token_urlsafe(32). The hash is taken
+        from the encoded bytes directly, so it matches hash_token(token)
+        without a separate str -> bytes round trip.
         """
-        return secrets.token_urlsafe(32)
+        token = base64.urlsafe_b64encode(secrets.token_bytes(32)).rstrip(b"=")
+        return token.decode("ascii"), hashlib.sha256(token).hexdigest()
 
-    def hash_token(self, token: str) -> str:
+    @staticmethod
+    def hash_token(token: str) -> str:
         """
         Hashes a token using SHA256.
+
+        Stored approval_token_hash values depend on this digest, and
+        Quote.verify_approval_token checks tokens with it.
         """
         return hashlib.sha256(token.encode()).hexdigest()
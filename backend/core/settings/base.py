@@ -1,3 +1,4 @@
+from datetime import timedelta
 from pathlib import Path
 import os
 import environ
@@ -119,6 +120,17 @@ if NAGS_DB_HOST:
 DATABASE_ROUTERS = ["vehicles.routers.NAGSRouter"]
 
 
+# Password hashing
+# Argon2id first; PBKDF2 stays listed so existing hashes verify and are
+# upgraded to Argon2 on the next successful login.
+PASSWORD_HASHERS = [
+    "core.hashers.TunedArgon2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -169,6 +181,10 @@ REST_FRAMEWORK = {
         "rest_framework_simplejwt.authentication.JWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "core.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 50,
     "EXCEPTION_HANDLER": "core.utils.exception_handler.custom_exception_handler",
@@ -218,9 +234,11 @@ SESSION_COOKIE_HTTPONLY = True
 SESSION_COOKIE_SAMESITE = "Lax"
 
 # Authentication Backends
+# EmailOrUsernameBackend subclasses ModelBackend and already accepts
+# usernames, so ModelBackend isn't listed again as a fallback: it would
+# repeat the lookup and run a second password hash on every failed login.
 AUTHENTICATION_BACKENDS = [
-    "core.backends.EmailOrUsernameBackend",  # Try email/username first
-    "django.contrib.auth.backends.ModelBackend",  # Fallback to default
+    "core.backends.EmailOrUsernameBackend",
 ]
 
 # Spectacular
@@ -232,8 +250,6 @@ SPECTACULAR_SETTINGS = {
 }
 
 # JWT Settings
-from datetime import timedelta  # noqa: E402
-
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(hours=1),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
@@ -243,6 +259,14 @@ SIMPLE_JWT = {
     "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
 }
 
+# Cache (shared by every web and Celery process, so invalidation is global)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": env("REDIS_URL"),
+    }
+}
+
 # Celery
 CELERY_BROKER_URL = env("REDIS_URL")
 CELERY_RESULT_BACKEND = env("REDIS_URL")
@@ -298,7 +322,9 @@ POST_OFFICE = {
     "BACKENDS": {
         "default": "django.core.mail.backends.smtp.EmailBackend",
     },
-    "DEFAULT_PRIORITY": "now",  # Send immediately, but with retry capability
+    # Queue instead of sending inline; the Celery-backed queue worker
+    # drains the queue in batches over one SMTP connection
+    "DEFAULT_PRIORITY": "medium",
     "CELERY_ENABLED": True,  # Use Celery for sending emails
     "MAX_RETRIES": 3,  # Retry failed emails up to 3 times
     "RETRY_INTERVAL": timedelta(minutes=5),  # Wait 5 minutes between retries
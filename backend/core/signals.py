@@ -0,0 +1,86 @@
+"""
+User signals for cached /me/ payload invalidation.
+
+Drops the cached serialized user and their cached Support Agent
+membership whenever the user row, their groups or their direct
+permissions change, or the Support Agent group is deleted. Both live in
+the shared cache, so one delete reaches every worker.
+"""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.dispatch import receiver
+
+from core import permissions
+from core.serializers import user_payload_cache_key
+
+User = get_user_model()
+
+
+def _invalidate_user_payloads(users):
+    """Drop the cached /me/ payload and Support Agent membership of users."""
+    keys = []
+    for user_id, password in users:
+        keys.append(user_payload_cache_key(user_id, password))
+        keys.append(permissions.support_agent_membership_cache_key(user_id))
+    if not keys:
+        return
+    cache.delete_many(keys)
+    # A request that read the old rows before this transaction commits can
+    # still write a stale payload back, so delete again once it's visible
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_payload_on_save(sender, instance, update_fields=None, **kwargs):
+    """
+    Invalidate the cached payload when a user is saved.
+
+    last_login-only updates don't touch any serialized field, so skip them.
+    """
+    if update_fields is not None and set(update_fields) == {"last_login"}:
+        return
+    _invalidate_user_payloads([(instance.pk, instance.password)])
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+def invalidate_user_payload_on_m2m(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    """
+    Invalidate cached payloads when group or permission membership changes.
+
+    Handles both directions: user.groups.add(...) and group.user_set.add(...).
+    """
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            # Drop the memoized group check and role on this instance as well
+            instance.__dict__.pop("_is_support_agent", None)
+            instance.__dict__.pop("_cached_role", None)
+            _invalidate_user_payloads([(instance.pk, instance.password)])
+        return
+
+    if action in ("post_add", "post_remove"):
+        users = User.objects.filter(pk__in=pk_set).values_list("pk", "password")
+    elif action == "pre_clear":
+        # Members are gone by post_clear, so collect them beforehand
+        users = instance.user_set.values_list("pk", "password")
+    else:
+        return
+    _invalidate_user_payloads(list(users))
+
+
+@receiver(pre_delete, sender=Group)
+def invalidate_member_payloads_on_group_delete(sender, instance, **kwargs):
+    """
+    Deleting the Support Agent group changes its members' role.
+
+    The membership rows are cascaded without m2m_changed, so collect the
+    members before they are gone.
+    """
+    if instance.name == permissions.SUPPORT_AGENT_GROUP:
+        _invalidate_user_payloads(list(instance.user_set.values_list("pk", "password")))
@@ -0,0 +1,22 @@
+import logging
+
+from celery import shared_task
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import RefreshToken
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def blacklist_refresh_token(refresh_token):
+    """
+    Blacklist a refresh token outside the request cycle.
+
+    Queued by LogoutView so the OutstandingToken/BlacklistedToken writes
+    don't hold up the logout response.
+    """
+    try:
+        RefreshToken(refresh_token).blacklist()
+    except TokenError as e:
+        # Expired or already blacklisted - nothing left to revoke
+        logger.info(f"Skipped blacklisting refresh token: {e}")
@@ -0,0 +1,342 @@
+import datetime
+from unittest import mock
+
+from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+
+from core.backends import EmailOrUsernameBackend
+from core.hashers import TunedArgon2PasswordHasher
+from core.permissions import (
+    SUPPORT_AGENT_GROUP,
+    support_agent_membership_cache_key,
+    user_is_support_agent,
+)
+from core.renderers import ORJSONRenderer
+from core.serializers import get_user_payload
+from core.validators import validate_vin_checksum
+
+User = get_user_model()
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class RefreshTokenViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        User.objects.create_user(
+            username="agent", email="agent@example.com", password="s3cret-pass"
+        )
+        response = self.client.post(
+            reverse("auth-login"),
+            {"email": "agent@example.com", "password": "s3cret-pass"},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.access_token = response.json()["access_token"]
+        self.refresh_token = response.cookies["refresh_token"].value
+
+    def refresh(self):
+        self.client.cookies["refresh_token"] = self.refresh_token
+        return self.client.post(reverse("auth-refresh"))
+
+    def test_repeated_refresh_returns_access_token(self):
+        first = self.refresh()
+        second = self.refresh()
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(first.json()["access_token"], second.json()["access_token"])
+
+    @mock.patch("core.auth_views.blacklist_refresh_token")
+    def test_refresh_after_logout_returns_401(self, blacklist_task):
+        # Warm the cache so the cached access token must not be served
+        self.assertEqual(self.refresh().status_code, 200)
+
+        response = self.client.post(
+            reverse("auth-logout"), HTTP_AUTHORIZATION=f"Bearer {self.access_token}"
+        )
+        self.assertEqual(response.status_code, 200)
+        # The blacklist task is queued but hasn't run
+        blacklist_task.delay.assert_called_once_with(self.refresh_token)
+
+        self.assertEqual(self.refresh().status_code, 401)
+
+    def test_refresh_works_when_cache_is_down(self):
+        with mock.patch("core.auth_views.cache") as broken_cache:
+            broken_cache.get.side_effect = ConnectionError
+            broken_cache.add.side_effect = ConnectionError
+            response = self.refresh()
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("access_token", response.json())
+
+    @mock.patch("core.auth_views.blacklist_refresh_token")
+    def test_logout_works_when_cache_is_down(self, blacklist_task):
+        with mock.patch("core.auth_views.cache") as broken_cache:
+            broken_cache.set.side_effect = ConnectionError
+            response = self.client.post(
+                reverse("auth-logout"),
+                HTTP_AUTHORIZATION=f"Bearer {self.access_token}",
+            )
+        self.assertEqual(response.status_code, 200)
+        blacklist_task.delay.assert_called_once_with(self.refresh_token)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class UserPayloadCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="csr", email="csr@example.com", password="s3cret-pass"
+        )
+        self.group = Group.objects.create(name=SUPPORT_AGENT_GROUP)
+
+    def payload(self):
+        # Fresh instance each time, as in a new request
+        return get_user_payload(User.objects.get(pk=self.user.pk))
+
+    def test_group_add_and_remove_invalidate_role(self):
+        self.assertEqual(self.payload()["role"], "customer")
+
+        self.user.groups.add(self.group)
+        self.assertEqual(self.payload()["role"], "support_agent")
+
+        self.user.groups.remove(self.group)
+        self.assertEqual(self.payload()["role"], "customer")
+
+    def test_reverse_group_change_invalidates_role(self):
+        self.assertEqual(self.payload()["role"], "customer")
+
+        self.group.user_set.add(self.user)
+        self.assertEqual(self.payload()["role"], "support_agent")
+
+        self.group.user_set.clear()
+        self.assertEqual(self.payload()["role"], "customer")
+
+    def test_group_delete_invalidates_role(self):
+        self.user.groups.add(self.group)
+        self.assertEqual(self.payload()["role"], "support_agent")
+
+        self.group.delete()
+        self.assertEqual(self.payload()["role"], "customer")
+
+    def test_permission_change_invalidates_permissions(self):
+        permission = Permission.objects.get(codename="view_group")
+        self.assertEqual(self.payload()["permissions"], [])
+
+        self.user.user_permissions.add(permission)
+        self.assertEqual(self.payload()["permissions"], ["view_group"])
+
+        self.user.user_permissions.remove(permission)
+        self.assertEqual(self.payload()["permissions"], [])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class EmailOrUsernameBackendTest(TestCase):
+    def setUp(self):
+        self.backend = EmailOrUsernameBackend()
+        self.user = User.objects.create_user(
+            username="jdoe", email="jdoe@example.com", password="s3cret-pass"
+        )
+
+    def authenticate(self, username, password):
+        return self.backend.authenticate(None, username=username, password=password)
+
+    def test_authenticates_by_email_or_username(self):
+        self.assertEqual(
+            self.authenticate("JDoe@Example.com", "s3cret-pass"), self.user
+        )
+        self.assertEqual(self.authenticate("jdoe", "s3cret-pass"), self.user)
+
+    def test_wrong_password(self):
+        self.assertIsNone(self.authenticate("jdoe@example.com", "wrong-pass"))
+
+    @mock.patch("core.backends.make_password", wraps=make_password)
+    def test_missing_user_runs_dummy_hash(self, hasher):
+        self.assertIsNone(self.authenticate("nobody@example.com", "s3cret-pass"))
+        hasher.assert_called_once_with("s3cret-pass")
+
+    @mock.patch("core.backends.make_password", wraps=make_password)
+    def test_disabled_user_runs_dummy_hash(self, hasher):
+        self.user.is_active = False
+        self.user.save()
+
+        with mock.patch.object(User, "check_password") as check_password:
+            self.assertIsNone(self.authenticate("jdoe@example.com", "s3cret-pass"))
+        check_password.assert_not_called()
+        hasher.assert_called_once_with("s3cret-pass")
+
+    def count_hashes(self, **credentials):
+        """Run django.contrib.auth.authenticate and count Argon2 hashes."""
+        hasher = TunedArgon2PasswordHasher
+        with mock.patch.object(
+            hasher, "encode", autospec=True, side_effect=hasher.encode
+        ) as encode, mock.patch.object(
+            hasher, "verify", autospec=True, side_effect=hasher.verify
+        ) as verify:
+            user = authenticate(None, **credentials)
+        return user, encode.call_count + verify.call_count
+
+    def test_unknown_identifier_runs_exactly_one_hash(self):
+        for username in ("nobody@example.com", "nobody"):
+            with self.subTest(username=username):
+                user, hashes = self.count_hashes(
+                    username=username, password="s3cret-pass"
+                )
+                self.assertIsNone(user)
+                self.assertEqual(hashes, 1)
+
+    def test_wrong_password_runs_exactly_one_hash(self):
+        for username in ("jdoe@example.com", "jdoe"):
+            with self.subTest(username=username):
+                user, hashes = self.count_hashes(
+                    username=username, password="wrong-pass"
+                )
+                self.assertIsNone(user)
+                self.assertEqual(hashes, 1)
+
+    def test_disabled_user_runs_exactly_one_hash(self):
+        self.user.is_active = False
+        self.user.save()
+
+        for username in ("jdoe@example.com", "jdoe"):
+            with self.subTest(username=username):
+                with mock.patch.object(User, "check_password") as check_password:
+                    user, hashes = self.count_hashes(
+                        username=username, password="s3cret-pass"
+                    )
+                self.assertIsNone(user)
+                self.assertEqual(hashes, 1)
+                check_password.assert_not_called()
+
+    def test_disabled_user_login_gets_invalid_credentials(self):
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.client.post(
+            reverse("auth-login"),
+            {"email": "jdoe@example.com", "password": "s3cret-pass"},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json(), {"error": "Invalid credentials"})
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SupportAgentMembershipTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="agent", email="agent@example.com", password="s3cret-pass"
+        )
+        self.group = Group.objects.create(name=SUPPORT_AGENT_GROUP)
+        self.user.groups.add(self.group)
+
+    def is_support_agent(self):
+        # Fresh instance each time, as in a new request
+        return user_is_support_agent(User.objects.get(pk=self.user.pk))
+
+    def test_membership_is_cached(self):
+        self.assertTrue(self.is_support_agent())
+        self.assertIs(cache.get(support_agent_membership_cache_key(self.user.pk)), True)
+
+    def test_removal_revokes_cached_membership(self):
+        self.assertTrue(self.is_support_agent())
+
+        self.user.groups.remove(self.group)
+        self.assertIsNone(cache.get(support_agent_membership_cache_key(self.user.pk)))
+        self.assertFalse(self.is_support_agent())
+
+    def test_reverse_removal_revokes_cached_membership(self):
+        self.assertTrue(self.is_support_agent())
+
+        self.group.user_set.remove(self.user)
+        self.assertFalse(self.is_support_agent())
+
+    def test_clear_revokes_cached_membership(self):
+        self.assertTrue(self.is_support_agent())
+
+        self.group.user_set.clear()
+        self.assertFalse(self.is_support_agent())
+
+    def test_group_delete_revokes_cached_membership(self):
+        self.assertTrue(self.is_support_agent())
+
+        self.group.delete()
+        self.assertFalse(self.is_support_agent())
+
+    def test_recreated_group_is_recognized(self):
+        self.group.delete()
+        self.assertFalse(self.is_support_agent())
+
+        self.user.groups.add(Group.objects.create(name=SUPPORT_AGENT_GROUP))
+        self.assertTrue(self.is_support_agent())
+
+
+class VinChecksumValidatorTest(SimpleTestCase):
+    def assertInvalid(self, vin, message):
+        with self.assertRaisesMessage(ValidationError, message):
+            validate_vin_checksum(vin)
+
+    def test_valid_vins(self):
+        for vin in (
+            "1HGCM82633A004352",
+            "JH4KA7561PC008269",
+            "11111111111111111",
+            "1M8GDM9AXKP042788",  # check digit X
+        ):
+            with self.subTest(vin=vin):
+                self.assertIsNone(validate_vin_checksum(vin))
+
+    def test_lowercase_vins_are_uppercased(self):
+        self.assertIsNone(validate_vin_checksum("1hgcm82633a004352"))
+        self.assertIsNone(validate_vin_checksum("1m8gdm9axkp042788"))
+
+    def test_wrong_check_digit(self):
+        for vin in (
+            "1HGCM82643A004352",
+            "1HGCM826X3A004352",
+            "1M8GDM9A0KP042788",
+            "1HGCM82633A004353",  # a changed character moves the checksum
+        ):
+            with self.subTest(vin=vin):
+                self.assertInvalid(vin, "Invalid VIN checksum")
+
+    def test_i_o_q_are_rejected(self):
+        for vin in ("IHGCM82633A004352", "1HGCM82633A0O4352", "1HGCM82633A00435Q"):
+            with self.subTest(vin=vin):
+                self.assertInvalid(vin, "VIN contains invalid characters")
+
+    def test_other_invalid_characters(self):
+        self.assertInvalid("1HGCM82633A00435-", "VIN contains invalid characters")
+
+    def test_wrong_length(self):
+        for vin in ("", "1HGCM82633A00435", "1HGCM82633A0043521"):
+            with self.subTest(vin=vin):
+                self.assertInvalid(vin, "VIN must be exactly 17 characters")
+
+
+class ORJSONRendererTest(SimpleTestCase):
+    def test_datetimes_match_drf_wire_format(self):
+        est = datetime.timezone(datetime.timedelta(hours=-5))
+        data = {
+            "utc": datetime.datetime(2024, 1, 2, 3, 4, 5, 678901, datetime.UTC),
+            "offset": datetime.datetime(2024, 1, 2, 3, 4, 5, 678901, est),
+            "date": datetime.date(2024, 1, 2),
+            "time": datetime.time(3, 4, 5, 678901),
+        }
+        rendered = ORJSONRenderer().render(data)
+        self.assertEqual(
+            rendered,
+            b'{"utc":"2024-01-02T03:04:05.678Z",'
+            b'"offset":"2024-01-02T03:04:05.678-05:00",'
+            b'"date":"2024-01-02","time":"03:04:05.678"}',
+        )
+        self.assertEqual(rendered, JSONRenderer().render(data))
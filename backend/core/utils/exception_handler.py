@@ -7,6 +7,13 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Error names for DRF "detail" responses, by status code
+_STATUS_ERROR_NAMES = {
+    404: "Not Found",
+    403: "Permission Denied",
+    401: "Unauthorized",
+}
+
 
 def custom_exception_handler(exc, context):
     """
@@ -19,10 +26,13 @@ def custom_exception_handler(exc, context):
     if response is None:
         # Handle Django ValidationErrors that DRF didn't catch
         if isinstance(exc, DjangoValidationError):
+            # Field errors go in details; a plain error's first message
+            # becomes the message
+            message_dict = getattr(exc, "message_dict", None)
             data = {
                 "error": "Validation Error",
-                "message": str(exc),
-                "details": exc.message_dict if hasattr(exc, "message_dict") else None,
+                "message": "Invalid input." if message_dict else exc.messages[0],
+                "details": message_dict or exc.messages,
             }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
@@ -54,12 +64,9 @@ def custom_exception_handler(exc, context):
     elif "detail" in response.data:
         formatted_data["message"] = response.data["detail"]
         # If it's a specific error type, we might want to map it
-        if response.status_code == 404:
-            formatted_data["error"] = "Not Found"
-        elif response.status_code == 403:
-            formatted_data["error"] = "Permission Denied"
-        elif response.status_code == 401:
-            formatted_data["error"] = "Unauthorized"
+        error_name = _STATUS_ERROR_NAMES.get(response.status_code)
+        if error_name is not None:
+            formatted_data["error"] = error_name
     else:
         formatted_data["details"] = response.data
 
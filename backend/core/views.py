@@ -6,8 +6,18 @@ from django.conf import settings
 from drf_spectacular.utils import extend_schema
 
 
+# Static part of the health payload, built once at import
+_HEALTH_PAYLOAD = {
+    "status": "ok",
+    "version": settings.SPECTACULAR_SETTINGS.get("VERSION", "1.0.0"),
+}
+
+
 class HealthCheckView(APIView):
+    # Probes hit this constantly: skip JWT parsing and the anon throttle
+    authentication_classes = []
     permission_classes = [AllowAny]
+    throttle_classes = []
 
     @extend_schema(
         summary="Health Check",
@@ -17,10 +27,4 @@ class HealthCheckView(APIView):
         },
     )
     def get(self, request):
-        return Response(
-            {
-                "status": "ok",
-                "version": settings.SPECTACULAR_SETTINGS.get("VERSION", "1.0.0"),
-                "timestamp": timezone.now().isoformat(),
-            }
-        )
+        return Response({**_HEALTH_PAYLOAD, "timestamp": timezone.now().isoformat()})
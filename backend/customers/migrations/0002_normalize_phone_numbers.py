@@ -45,14 +45,24 @@ def normalize_customer_phones(apps, schema_editor):
     """Normalize all existing customer phone numbers to E.164 format."""
     Customer = apps.get_model("customers", "Customer")
 
+    # The historical model has no custom save() and no signal receivers, so
+    # bulk_update writes the same rows without queueing a Chatwoot sync each
     updated_count = 0
-    for customer in Customer.objects.all():
+    batch = []
+    for customer in Customer.objects.only("id", "phone").iterator(chunk_size=2000):
         if customer.phone:
             normalized = normalize_phone_e164(customer.phone)
             if normalized != customer.phone:
                 customer.phone = normalized
-                customer.save(update_fields=["phone"])
-                updated_count += 1
+                batch.append(customer)
+        if len(batch) >= 2000:
+            Customer.objects.bulk_update(batch, ["phone"])
+            updated_count += len(batch)
+            batch = []
+
+    if batch:
+        Customer.objects.bulk_update(batch, ["phone"])
+        updated_count += len(batch)
 
     if updated_count > 0:
         print(f"\n  Normalized {updated_count} phone number(s) to E.164 format")
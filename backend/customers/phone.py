@@ -0,0 +1,60 @@
+class _PhoneChars(dict):
+    """
+    str.translate table that keeps decimal digits and "+" and drops the rest.
+
+    Equivalent to re.sub(r"[^\\d+]", "", phone). Latin-1 is filled in up
+    front; anything else is classified on first sight, and only cached
+    when kept, so odd input can't grow the table without bound.
+    """
+
+    def __missing__(self, codepoint):
+        if chr(codepoint).isdecimal():
+            self[codepoint] = codepoint
+            return codepoint
+        return None
+
+
+_PHONE_CHARS = _PhoneChars(
+    (c, c if chr(c).isdecimal() or chr(c) == "+" else None) for c in range(256)
+)
+
+
+def normalize_e164(phone: str) -> str:
+    """
+    Normalize phone number to E.164 format (+1XXXXXXXXXX).
+
+    E.164 is the international standard required by SMS providers (Twilio)
+    and Chatwoot for reliable message delivery.
+
+    Examples:
+        - "(555) 123-4567" -> "+15551234567"
+        - "+1-204-963-1621" -> "+12049631621"
+        - "5551234567" -> "+15551234567"
+    """
+    if not phone:
+        return phone
+
+    # Remove all non-digit characters except +
+    cleaned = phone.translate(_PHONE_CHARS)
+
+    # If already starts with +, it's formatted - just return cleaned version
+    if cleaned.startswith("+"):
+        return cleaned
+
+    # Remove leading zeros
+    cleaned = cleaned.lstrip("0")
+
+    # 10-digit US number -> add +1
+    if len(cleaned) == 10:
+        return f"+1{cleaned}"
+
+    # 11-digit starting with 1 (US with country code) -> add +
+    if len(cleaned) == 11 and cleaned.startswith("1"):
+        return f"+{cleaned}"
+
+    # For other formats with enough digits, assume US and add +1
+    if len(cleaned) >= 7:
+        return f"+1{cleaned}"
+
+    # Return as-is if we can't normalize
+    return phone
@@ -7,6 +7,7 @@ Automatically syncs customers to Chatwoot when created or updated.
 import logging
 
 from django.conf import settings
+from django.db import transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
@@ -21,7 +22,9 @@ def sync_customer_to_chatwoot(sender, instance, created, **kwargs):
     Sync customer to Chatwoot after save.
 
     Runs async via Celery to avoid blocking the request.
-    Only syncs if Chatwoot is configured.
+    Only syncs if Chatwoot is configured. The task is queued once the
+    surrounding transaction commits, so the worker never reads a customer
+    row that isn't visible yet (or was rolled back).
     """
     # Check if Chatwoot is configured
     chatwoot_url = getattr(settings, "CHATWOOT_BASE_URL", "")
@@ -31,11 +34,17 @@ def sync_customer_to_chatwoot(sender, instance, created, **kwargs):
     # Import here to avoid circular imports
     from integrations.chatwoot.tasks import sync_customer_to_chatwoot_task
 
-    # Queue sync task
-    try:
-        sync_customer_to_chatwoot_task.delay(instance.id)
-        action = "created" if created else "updated"
-        logger.debug(f"Queued Chatwoot sync for {action} customer {instance.id}")
-    except Exception as e:
-        # Don't fail the save if task queueing fails
-        logger.error(f"Failed to queue Chatwoot sync for customer {instance.id}: {e}")
+    customer_id = instance.id
+    action = "created" if created else "updated"
+
+    def queue_sync():
+        try:
+            sync_customer_to_chatwoot_task.delay(customer_id)
+            logger.debug(f"Queued Chatwoot sync for {action} customer {customer_id}")
+        except Exception as e:
+            # Don't fail the request if task queueing fails
+            logger.error(
+                f"Failed to queue Chatwoot sync for customer {customer_id}: {e}"
+            )
+
+    transaction.on_commit(queue_sync)
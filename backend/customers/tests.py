@@ -1,5 +1,10 @@
-from django.test import TestCase  # noqa: F401
+import re
+
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, TestCase
 from .models import Customer
+from .phone import _PHONE_CHARS, normalize_e164
+from core.validators import validate_phone_e164
 from django.contrib.gis.geos import Point
 
 
@@ -26,3 +31,65 @@ class CustomerModelTest(TestCase):
         self.customer.state = "CA"
         self.customer.save()
         self.assertTrue(self.customer.has_complete_address())
+
+    def test_save_normalizes_phone(self):
+        self.customer.phone = "(555) 123-4567"
+        self.customer.save()
+        self.customer.refresh_from_db()
+        self.assertEqual(self.customer.phone, "+15551234567")
+
+
+class NormalizeE164Test(SimpleTestCase):
+    def test_formatted_us_numbers(self):
+        for phone in ("(555) 123-4567", "555.123.4567", "555 123 4567", "5551234567"):
+            with self.subTest(phone=phone):
+                self.assertEqual(normalize_e164(phone), "+15551234567")
+
+    def test_leading_one(self):
+        self.assertEqual(normalize_e164("1-555-123-4567"), "+15551234567")
+        self.assertEqual(normalize_e164("1 (204) 963-1621"), "+12049631621")
+
+    def test_leading_zeros_are_dropped(self):
+        self.assertEqual(normalize_e164("005551234567"), "+15551234567")
+
+    def test_already_e164(self):
+        self.assertEqual(normalize_e164("+12049631621"), "+12049631621")
+        self.assertEqual(normalize_e164("+1-204-963-1621"), "+12049631621")
+        self.assertEqual(normalize_e164("+44 20 7946 0958"), "+442079460958")
+
+    def test_non_ascii_separators_are_stripped(self):
+        # En dashes and non-breaking spaces from pasted numbers
+        self.assertEqual(normalize_e164("555\u2013123\u20134567"), "+15551234567")
+        self.assertEqual(normalize_e164("555\xa0123\xa04567"), "+15551234567")
+
+    def test_non_ascii_digits_match_regex_cleaning(self):
+        # Unicode decimal digits are kept, exactly as re.sub(r"[^\d+]") did
+        arabic_indic = "\u0665\u0665\u0665\u0661\u0662\u0663\u0664\u0665\u0666\u0667"
+        fullwidth = "\uff15\uff15\uff15-123-4567"
+        for phone in (arabic_indic, fullwidth):
+            with self.subTest(phone=phone):
+                cleaned = re.sub(r"[^\d+]", "", phone)
+                self.assertEqual(phone.translate(_PHONE_CHARS), cleaned)
+                self.assertEqual(normalize_e164(phone), f"+1{cleaned}")
+
+    def test_dropped_characters_are_not_cached(self):
+        size = len(_PHONE_CHARS)
+        normalize_e164("555\u2013123\u2014\u20154567")
+        self.assertEqual(len(_PHONE_CHARS), size)
+
+    def test_empty(self):
+        self.assertEqual(normalize_e164(""), "")
+        self.assertIsNone(normalize_e164(None))
+
+    def test_too_short_is_returned_unchanged_and_fails_validation(self):
+        for phone in ("123", "555-12", "12-34-5"):
+            with self.subTest(phone=phone):
+                self.assertEqual(normalize_e164(phone), phone)
+                with self.assertRaises(ValidationError):
+                    validate_phone_e164(normalize_e164(phone))
+
+    def test_too_long_fails_validation(self):
+        normalized = normalize_e164("+1 555 123 4567 8901 23")
+        self.assertEqual(normalized, "+15551234567890123")
+        with self.assertRaises(ValidationError):
+            validate_phone_e164(normalized)
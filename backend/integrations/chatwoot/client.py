@@ -8,8 +8,11 @@ import logging
 from typing import Any, Optional
 from urllib.parse import urljoin
 
+import orjson
 import requests
 from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +39,11 @@ class ChatwootClient:
         conversations = client.get_contact_conversations(contact_id=123)
     """
 
+    # Shared by every client in the process so repeated calls reuse pooled
+    # keep-alive connections instead of a new TCP/TLS handshake each time.
+    # Auth headers stay per request since clients may use different tokens.
+    _session: Optional[requests.Session] = None
+
     def __init__(
         self,
         base_url: Optional[str] = None,
@@ -46,6 +54,15 @@ class ChatwootClient:
         self.api_token = api_token or getattr(settings, "CHATWOOT_API_TOKEN", "")
         self.account_id = account_id or getattr(settings, "CHATWOOT_ACCOUNT_ID", 1)
 
+        # Built once; every request reuses the same prefix and headers
+        self._url_prefix = (
+            f"{self.base_url.rstrip('/')}/api/v1/accounts/{self.account_id}/"
+        )
+        self._headers = {
+            "api_access_token": self.api_token,
+            "Content-Type": "application/json",
+        }
+
         if not self.base_url:
             logger.warning("CHATWOOT_BASE_URL not configured")
         if not self.api_token:
@@ -56,17 +73,28 @@ class ChatwootClient:
         """Check if Chatwoot is properly configured."""
         return bool(self.base_url and self.api_token)
 
-    def _get_headers(self) -> dict:
-        """Get headers for API requests."""
-        return {
-            "api_access_token": self.api_token,
-            "Content-Type": "application/json",
-        }
-
-    def _build_url(self, endpoint: str) -> str:
-        """Build full URL for API endpoint."""
-        base = self.base_url.rstrip("/")
-        return f"{base}/api/v1/accounts/{self.account_id}/{endpoint.lstrip('/')}"
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Get the shared HTTP session, creating it on first use."""
+        if cls._session is None:
+            # Only idempotent methods are retried, so a POST that reached
+            # Chatwoot is never sent twice. raise_on_status=False hands the
+            # last error response back to _request for normal handling.
+            retry = Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=["GET", "PUT", "DELETE"],
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=10, pool_maxsize=50, max_retries=retry
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            cls._session = session
+        return cls._session
 
     def _request(
         self,
@@ -93,14 +121,15 @@ class ChatwootClient:
         if not self.is_configured:
             raise ChatwootError("Chatwoot is not configured. Set CHATWOOT_BASE_URL and CHATWOOT_API_TOKEN.")
 
-        url = self._build_url(endpoint)
+        url = self._url_prefix + endpoint.lstrip("/")
 
         try:
-            response = requests.request(
+            response = self._get_session().request(
                 method=method,
                 url=url,
-                headers=self._get_headers(),
-                json=data,
+                headers=self._headers,
+                # Encoded with orjson; Content-Type comes from self._headers
+                data=orjson.dumps(data) if data is not None else None,
                 params=params,
                 timeout=30,
             )
@@ -113,7 +142,7 @@ class ChatwootClient:
 
             # Handle errors
             if response.status_code >= 400:
-                error_data = response.json() if response.content else {}
+                error_data = orjson.loads(response.content) if response.content else {}
                 error_message = error_data.get("error", error_data.get("message", f"HTTP {response.status_code}"))
                 raise ChatwootError(
                     message=error_message,
@@ -121,9 +150,9 @@ class ChatwootClient:
                     response=error_data,
                 )
 
-            return response.json() if response.content else {}
+            return orjson.loads(response.content) if response.content else {}
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Chatwoot API request failed: {e}", extra={"url": url})
             raise ChatwootError(f"Request failed: {str(e)}")
 
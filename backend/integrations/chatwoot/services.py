@@ -21,6 +21,9 @@ logger = logging.getLogger(__name__)
 # Lock timeout for sync operations (seconds)
 SYNC_LOCK_TIMEOUT = 30
 
+# How long a customer's Chatwoot contact ID is remembered (seconds)
+CONTACT_ID_CACHE_TIMEOUT = 60 * 60 * 24
+
 
 def format_phone_e164(phone: Optional[str], default_country_code: str = "+1") -> Optional[str]:
     """
@@ -128,6 +131,28 @@ class ContactSyncService(BaseService):
             # Format phone to E.164 (Chatwoot requires this format)
             formatted_phone = format_phone_e164(customer.phone)
 
+            # Known customers go straight to an update, skipping the contact
+            # search. A 404 means the contact was deleted or merged away.
+            contact_id_key = self._contact_id_cache_key(customer)
+            cached_contact_id = cache.get(contact_id_key)
+            if cached_contact_id:
+                try:
+                    contact = self.client.update_contact(
+                        contact_id=cached_contact_id,
+                        email=customer.email,
+                        phone=formatted_phone,
+                        name=customer.get_full_name() or customer.email,
+                        custom_attributes=custom_attributes,
+                    )
+                    cache.set(
+                        contact_id_key, cached_contact_id, CONTACT_ID_CACHE_TIMEOUT
+                    )
+                    return contact
+                except ChatwootError as e:
+                    if e.status_code != 404:
+                        raise
+                    cache.delete(contact_id_key)
+
             contact, created = self.client.get_or_create_contact(
                 email=customer.email,
                 phone=formatted_phone,
@@ -152,6 +177,8 @@ class ContactSyncService(BaseService):
                     custom_attributes=custom_attributes,
                 )
 
+            if contact.get("id"):
+                cache.set(contact_id_key, contact["id"], CONTACT_ID_CACHE_TIMEOUT)
             return contact
 
         except ChatwootError as e:
@@ -235,17 +262,29 @@ class ContactSyncService(BaseService):
         if not self.client.is_configured:
             return None
 
+        contact_id_key = self._contact_id_cache_key(customer)
+        contact_id = cache.get(contact_id_key)
+        if contact_id:
+            return contact_id
+
         # Use email as identifier for unified contact linking
         identifier = customer.email
 
         try:
             contacts = self.client.search_contacts(identifier)
             if contacts:
-                return contacts[0].get("id")
+                contact_id = contacts[0].get("id")
+                if contact_id:
+                    cache.set(contact_id_key, contact_id, CONTACT_ID_CACHE_TIMEOUT)
+                return contact_id
             return None
         except ChatwootError:
             return None
 
+    def _contact_id_cache_key(self, customer) -> str:
+        """Cache key for a customer's Chatwoot contact ID."""
+        return f"chatwoot_contact_id_{self.client.account_id}_{customer.id}"
+
 
 class ConversationService(BaseService):
     """
@@ -1,34 +1,8 @@
-import re
 from rest_framework import serializers
+from customers.phone import normalize_e164
 from quotes.models import Quote
 
 
-def normalize_phone_e164(phone: str) -> str:
-    """
-    Normalize phone number to E.164 format (+1XXXXXXXXXX).
-    """
-    if not phone:
-        return phone
-
-    cleaned = re.sub(r"[^\d+]", "", phone)
-
-    if cleaned.startswith("+"):
-        return cleaned
-
-    cleaned = cleaned.lstrip("0")
-
-    if len(cleaned) == 10:
-        return f"+1{cleaned}"
-
-    if len(cleaned) == 11 and cleaned.startswith("1"):
-        return f"+{cleaned}"
-
-    if len(cleaned) >= 7:
-        return f"+1{cleaned}"
-
-    return phone
-
-
 class QuoteLocationSerializer(serializers.Serializer):
     postal_code = serializers.CharField()
     street_address = serializers.CharField(required=False, allow_blank=True)
@@ -52,7 +26,7 @@ class QuoteCustomerSerializer(serializers.Serializer):
 
     def validate_phone(self, value):
         """Normalize phone number to E.164 format."""
-        return normalize_phone_e164(value)
+        return normalize_e164(value)
 
 
 class QuoteGenerationRequestSerializer(serializers.Serializer):
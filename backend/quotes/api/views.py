@@ -1,3 +1,5 @@
+import logging
+
 from rest_framework.views import APIView
 from rest_framework.generics import RetrieveAPIView
 from rest_framework.response import Response
@@ -17,6 +19,8 @@ from quotes.api.serializers import (
     ApproveQuoteSerializer,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class GenerateQuoteView(APIView):
     """
@@ -239,20 +243,8 @@ class ApproveQuoteView(APIView):
                 {"error": "Quote not found."}, status=status.HTTP_404_NOT_FOUND
             )
 
-        # Validate token
-        # We need to hash the incoming token and compare with stored hash
-        # We can use EmailService helper or just do it here.
-        # Since EmailService has the logic, let's use it or replicate it.
-        # Replicating is safer to avoid instantiating a service just
-        # for a static method.
-        import hashlib
-        from django.utils.crypto import constant_time_compare
-
-        token_hash = hashlib.sha256(token.encode()).hexdigest()
-
-        if not quote.approval_token_hash or not constant_time_compare(
-            quote.approval_token_hash, token_hash
-        ):
+        # Validate token against the stored hash
+        if not quote.verify_approval_token(token):
             return Response(
                 {"error": "Invalid approval token."}, status=status.HTTP_400_BAD_REQUEST
             )
@@ -281,10 +273,15 @@ class ApproveQuoteView(APIView):
             )
 
         # Trigger confirmation email
-        from core.services.email_service import EmailService
+        from quotes.tasks import send_approval_confirmation_email
 
-        email_service = EmailService()
-        email_service.send_approval_confirmation(quote)
+        try:
+            send_approval_confirmation_email.delay(quote.id)
+        except Exception as e:
+            # Broker unavailable - the approval is already saved, so queue
+            # the email inline rather than fail the request
+            logger.warning(f"Failed to queue approval confirmation email: {e}")
+            send_approval_confirmation_email(quote.id)
 
         return Response(
             {"status": "approved", "message": "Quote approved successfully."},
@@ -1,5 +1,6 @@
 from django.db import models  # noqa: F401
 import uuid
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from django_fsm import FSMField, transition
 from django.contrib.auth import get_user_model
@@ -133,24 +134,29 @@ class Quote(models.Model):
     def __str__(self):
         return f"Quote {self.id} ({self.state})"
 
+    @cached_property
+    def vehicle_desc(self) -> str:
+        """Returns the vehicle as "year make model" for emails and listings."""
+        v = self.vehicle_info or {}
+        return f"{v.get('year')} {v.get('make')} {v.get('model')}"
+
     def verify_approval_token(self, token: str) -> bool:
         """
-        Verifies if the provided token matches the stored hash and is not expired.
-        """
-        import hashlib
-        from django.utils import timezone
-        from datetime import timedelta
+        Verifies if the provided token matches the stored hash.
 
-        if not self.approval_token_hash or not self.approval_token_created_at:
-            return False
+        Hashed with EmailService.hash_token, the same digest used when the
+        token is issued. Expiry is checked separately by
+        is_approval_token_expired.
+        """
+        from django.utils.crypto import constant_time_compare
+        from core.services.email_service import EmailService
 
-        # Check expiration (24 hours)
-        if timezone.now() > self.approval_token_created_at + timedelta(hours=24):
+        if not self.approval_token_hash:
             return False
 
-        # Verify hash
-        token_hash = hashlib.sha256(token.encode()).hexdigest()
-        return token_hash == self.approval_token_hash
+        return constant_time_compare(
+            self.approval_token_hash, EmailService.hash_token(token)
+        )
 
     def is_approval_token_expired(self) -> bool:
         from django.utils import timezone
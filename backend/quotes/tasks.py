@@ -25,6 +25,27 @@ def serialize_decimals(obj):
     return obj
 
 
+def create_line_items(quote, line_items):
+    """
+    Insert the priced line items for a quote in a single query.
+    """
+    QuoteLineItem.objects.bulk_create(
+        [
+            QuoteLineItem(
+                quote=quote,
+                type=item.get("type"),
+                description=item.get("description"),
+                unit_price=item.get("unit_price"),
+                quantity=item.get("quantity"),
+                # bulk_create skips QuoteLineItem.save(), so apply its
+                # subtotal rule here
+                subtotal=item.get("unit_price") * item.get("quantity"),
+            )
+            for item in line_items
+        ]
+    )
+
+
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
 def generate_quote_task(
     self,
@@ -197,15 +218,7 @@ def _generate_chip_repair_quote(
     )
 
     # Create Line Items
-    for item in chip_pricing.line_items:
-        QuoteLineItem.objects.create(
-            quote=quote,
-            type=item.get("type"),
-            description=item.get("description"),
-            unit_price=item.get("unit_price"),
-            quantity=item.get("quantity"),
-            subtotal=item.get("subtotal"),
-        )
+    create_line_items(quote, chip_pricing.line_items)
 
     logger.info(f"Chip repair quote {quote.id} created successfully.")
 
@@ -368,15 +381,7 @@ def _generate_replacement_quote(
     )
 
     # Create Line Items
-    for item in quote_pricing.line_items:
-        QuoteLineItem.objects.create(
-            quote=quote,
-            type=item.get("type"),
-            description=item.get("description"),
-            unit_price=item.get("unit_price"),
-            quantity=item.get("quantity"),
-            subtotal=item.get("subtotal"),
-        )
+    create_line_items(quote, quote_pricing.line_items)
 
     logger.info(f"Replacement quote {quote.id} created successfully.")
 
@@ -422,7 +427,7 @@ def send_quote_received_email(quote_id):
     from core.services.email_service import EmailService
 
     try:
-        quote = Quote.objects.get(id=quote_id)
+        quote = Quote.objects.select_related("customer").get(id=quote_id)
         email_service = EmailService()
         email_service.send_quote_received(quote)
 
@@ -446,7 +451,7 @@ def send_quote_email(quote_id):
     from core.services.email_service import EmailService
 
     try:
-        quote = Quote.objects.get(id=quote_id)
+        quote = Quote.objects.select_related("customer", "shop").get(id=quote_id)
         email_service = EmailService()
         email_service.send_quote(quote)
 
@@ -472,7 +477,7 @@ def send_quote_pending_review_email(quote_id):
     from core.services.email_service import EmailService
 
     try:
-        quote = Quote.objects.get(id=quote_id)
+        quote = Quote.objects.select_related("customer", "shop").get(id=quote_id)
         email_service = EmailService()
         email_service.send_quote_pending_review(quote)
 
@@ -484,6 +489,48 @@ def send_quote_pending_review_email(quote_id):
         logger.error(f"Error sending pending review email for {quote_id}: {str(e)}")
 
 
+@shared_task
+def send_rejection_email(quote_id, reason):
+    """
+    Sends the rejection email for a quote rejected by a support agent.
+    """
+    from core.services.email_service import EmailService
+
+    try:
+        quote = Quote.objects.select_related("customer").get(id=quote_id)
+        email_service = EmailService()
+        email_service.send_rejection(quote, reason)
+
+        logger.info(f"Rejection email sent for quote {quote_id}")
+
+    except Quote.DoesNotExist:
+        logger.error(f"Quote {quote_id} not found for rejection email")
+    except Exception as e:
+        logger.error(f"Error sending rejection email for {quote_id}: {str(e)}")
+
+
+@shared_task
+def send_approval_confirmation_email(quote_id):
+    """
+    Sends the confirmation email after a customer approves their quote.
+    """
+    from core.services.email_service import EmailService
+
+    try:
+        quote = Quote.objects.select_related("customer").get(id=quote_id)
+        email_service = EmailService()
+        email_service.send_approval_confirmation(quote)
+
+        logger.info(f"Approval confirmation email sent for quote {quote_id}")
+
+    except Quote.DoesNotExist:
+        logger.error(f"Quote {quote_id} not found for approval confirmation email")
+    except Exception as e:
+        logger.error(
+            f"Error sending approval confirmation email for {quote_id}: {str(e)}"
+        )
+
+
 @shared_task
 def expire_old_quotes():
     """
@@ -1,3 +1,19 @@
-from django.test import TestCase  # noqa: F401
+from django.test import SimpleTestCase
 
-# Create your tests here.
+from core.services.email_service import EmailService
+from quotes.models import Quote
+
+
+class VerifyApprovalTokenTest(SimpleTestCase):
+    def setUp(self):
+        self.token, token_hash = EmailService().generate_secure_token()
+        self.quote = Quote(approval_token_hash=token_hash)
+
+    def test_issued_token_verifies(self):
+        self.assertTrue(self.quote.verify_approval_token(self.token))
+
+    def test_wrong_token_is_rejected(self):
+        self.assertFalse(self.quote.verify_approval_token(self.token + "x"))
+
+    def test_quote_without_token_is_rejected(self):
+        self.assertFalse(Quote().verify_approval_token(self.token))
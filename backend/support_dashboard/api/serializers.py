@@ -425,11 +425,7 @@ class CustomerDetailSerializer(serializers.ModelSerializer):
         return [
             {
                 "id": str(q.id),
-                "vehicle": (
-                    f"{q.vehicle_info.get('year')} "
-                    f"{q.vehicle_info.get('make')} "
-                    f"{q.vehicle_info.get('model')}"
-                ),
+                "vehicle": q.vehicle_desc,
                 "total": q.total_price,
                 "state": q.state,
                 "created_at": q.created_at,
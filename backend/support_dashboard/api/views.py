@@ -2,6 +2,8 @@
 Support dashboard API views for quote management.
 """
 
+import logging
+
 from rest_framework import generics, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -25,6 +27,8 @@ from support_dashboard.api.serializers import (
 )
 from decimal import Decimal
 
+logger = logging.getLogger(__name__)
+
 
 class QuoteQueueView(generics.ListAPIView):
     """
@@ -120,6 +124,7 @@ class QuoteModifyView(generics.UpdateAPIView):
         # Update line items
         if "line_items" in serializer.validated_data:
             line_items_data = serializer.validated_data["line_items"]
+            new_items = []
 
             for item_data in line_items_data:
                 if "id" in item_data:
@@ -136,16 +141,22 @@ class QuoteModifyView(generics.UpdateAPIView):
                             status=status.HTTP_400_BAD_REQUEST,
                         )
                 else:
-                    # Add new custom item
-                    QuoteLineItem.objects.create(
-                        quote=quote,
-                        type=item_data["type"],
-                        description=item_data["description"],
-                        unit_price=Decimal(str(item_data["subtotal"])),
-                        quantity=1,
-                        subtotal=Decimal(str(item_data["subtotal"])),
+                    # Add new custom item (inserted together below)
+                    new_items.append(
+                        QuoteLineItem(
+                            quote=quote,
+                            type=item_data["type"],
+                            description=item_data["description"],
+                            unit_price=Decimal(str(item_data["subtotal"])),
+                            quantity=1,
+                            subtotal=Decimal(str(item_data["subtotal"])),
+                        )
                     )
 
+            # quantity is always 1, so subtotal already matches what
+            # QuoteLineItem.save() would compute
+            QuoteLineItem.objects.bulk_create(new_items)
+
             # Recalculate total
             total = sum(item.subtotal for item in quote.line_items.all())
             quote.total_price = total
@@ -282,10 +293,15 @@ class RejectQuoteView(APIView):
             )
 
         # Trigger rejection email
-        from core.services.email_service import EmailService
+        from quotes.tasks import send_rejection_email
 
-        email_service = EmailService()
-        email_service.send_rejection(quote, reason)
+        try:
+            send_rejection_email.delay(quote.id, reason)
+        except Exception as e:
+            # Broker unavailable - the rejection is already saved, so queue
+            # the email inline rather than fail the request
+            logger.warning(f"Failed to queue rejection email: {e}")
+            send_rejection_email(quote.id, reason)
 
         return Response(
             {
@@ -5,8 +5,10 @@ Creates support agent users with emails matching Chatwoot agent accounts.
 """
 
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import Group
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 from support_dashboard.models import AgentProfile
 
@@ -58,6 +60,7 @@ class Command(BaseCommand):
             help="Show what would be created without making changes",
         )
 
+    @transaction.atomic
     def handle(self, *args, **options):
         dry_run = options["dry_run"]
 
@@ -71,53 +74,77 @@ class Command(BaseCommand):
                 self.style.SUCCESS("Created 'Support Agent' group")
             )
 
+        # Look up existing agent users and their profiles in one query each.
+        # New users, their group memberships and all missing profiles are
+        # inserted together after the loop.
+        emails = [a["email"] for a in AGENTS]
+        existing_users = {
+            user.email: user for user in User.objects.filter(email__in=emails)
+        }
+        emails_with_profile = set(
+            AgentProfile.objects.filter(user__email__in=emails).values_list(
+                "user__email", flat=True
+            )
+        )
+        new_users = []
+        profiles = []
+
         for agent_data in AGENTS:
             email = agent_data["email"]
             username = agent_data["username"]
 
             # Check if user already exists
-            existing_user = User.objects.filter(email=email).first()
+            existing_user = existing_users.get(email)
             if existing_user:
                 self.stdout.write(
                     self.style.WARNING(f"User already exists: {email}")
                 )
                 # Ensure they have an AgentProfile
-                if not dry_run:
-                    profile, created = AgentProfile.objects.get_or_create(
-                        user=existing_user,
-                        defaults={"chatwoot_email": email},
+                if not dry_run and email not in emails_with_profile:
+                    profiles.append(
+                        AgentProfile(user=existing_user, chatwoot_email=email)
+                    )
+                    self.stdout.write(
+                        f"  Created AgentProfile for existing user"
                     )
-                    if created:
-                        self.stdout.write(
-                            f"  Created AgentProfile for existing user"
-                        )
                 continue
 
             if dry_run:
                 self.stdout.write(f"Would create user: {username} ({email})")
                 continue
 
-            # Create the user
-            user = User.objects.create_user(
-                username=username,
-                email=email,
-                password=agent_data["password"],
-                first_name=agent_data.get("first_name", ""),
-                last_name=agent_data.get("last_name", ""),
-                is_staff=agent_data.get("is_staff", False),
+            new_users.append(
+                User(
+                    username=username,
+                    email=User.objects.normalize_email(email),
+                    password=make_password(agent_data["password"]),
+                    first_name=agent_data.get("first_name", ""),
+                    last_name=agent_data.get("last_name", ""),
+                    is_staff=agent_data.get("is_staff", False),
+                )
             )
 
-            # Add to Support Agent group
-            user.groups.add(support_group)
-
-            # Create AgentProfile
-            AgentProfile.objects.create(
-                user=user,
-                chatwoot_email=email,
-            )
+        # Create the users, add them to the Support Agent group and give
+        # each an AgentProfile
+        created_users = User.objects.bulk_create(new_users)
+        Membership = User.groups.through
+        Membership.objects.bulk_create(
+            [
+                Membership(user_id=user.pk, group_id=support_group.pk)
+                for user in created_users
+            ],
+            ignore_conflicts=True,
+        )
+        profiles.extend(
+            AgentProfile(user=user, chatwoot_email=user.email)
+            for user in created_users
+        )
+        # The one-to-one user column makes this safe to rerun
+        AgentProfile.objects.bulk_create(profiles, ignore_conflicts=True)
 
+        for user in created_users:
             self.stdout.write(
-                self.style.SUCCESS(f"Created user: {username} ({email})")
+                self.style.SUCCESS(f"Created user: {user.username} ({user.email})")
             )
 
         self.stdout.write(self.style.SUCCESS("\nDone!"))